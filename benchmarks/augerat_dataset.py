@@ -38,6 +38,9 @@ class AugeratDataSet:
         path (str) : Path to data folder.
         instance_name (str) : Name of instance to read.
     """
+    # Header values (best known solution, capacity) per (path, instance)
+    _header_cache = {}
+
     def __init__(self, path: Path, instance_name):
         self.G: DiGraph = None
         self.best_known_solution: int = None
@@ -49,15 +52,9 @@ class AugeratDataSet:
 
     def _load(self, path, instance_name):
         """Load Augerat instance into a DiGraph"""
-        # Read vehicle capacity
-        with open(path / instance_name) as fp:
-            for i, line in enumerate(fp):
-                if i == 1:
-                    best = line.split()[-1][:-1]
-                    self.best_known_solution = int(best)
-                if i == 5:
-                    self.max_load = int(line.split()[2])
-        fp.close()
+        # Read best known solution and vehicle capacity
+        self.best_known_solution, self.max_load = self._read_header(
+            path, instance_name)
         # Create network and store name + capacity
         self.G = DiGraph(
             name=instance_name[:-4],
@@ -112,3 +109,20 @@ class AugeratDataSet:
         after = [v - 1 for v in self.G.nodes() if v not in ["Source", "Sink"]]
         mapping = dict(zip(before, after))
         self.G = relabel_nodes(self.G, mapping)
+
+    @classmethod
+    def _read_header(cls, path, instance_name):
+        """
+        Returns best known solution and vehicle capacity of an instance.
+        Values are parsed once per instance and cached afterwards.
+        """
+        key = (str(path), instance_name)
+        if key not in cls._header_cache:
+            with open(path / instance_name) as fp:
+                lines = fp.read().splitlines()
+            # A value of 0 is not a valid best known solution
+            best_known_solution = int(
+                lines[1].split()[-1].rstrip(")")) or None
+            max_load = int(lines[5].split()[2])
+            cls._header_cache[key] = (best_known_solution, max_load)
+        return cls._header_cache[key]
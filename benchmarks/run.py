@@ -2,8 +2,9 @@
 from time import time
 import argparse
 from itertools import product
-from logging import getLogger
-from multiprocessing import Pool, cpu_count
+from logging import basicConfig, getLogger, INFO
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 from pathlib import Path
 from typing import List, Dict, Union
 
@@ -95,12 +96,19 @@ def run_series():
     """Iterates through all problem instances and creates csv table
     in a new folder `benchmarks/results/` in series
     """
+    # Rows are streamed to file as the problems are solved
+    CsvTable.write_many(table for table in _solve_series() if table)
+
+
+def _solve_series():
+    """Yields the results of each problem solved in series."""
     for instance_type in INSTANCE_TYPES:
         path_to_instance_type = INPUT_FOLDER / instance_type
         for path_to_instance in path_to_instance_type.glob("*"):
             if PERFORMANCE:
-                _run_single_problem(path_to_instance,
-                                    **PERFORMANCE_SOLVER_PARAMS[instance_type])
+                yield _run_single_problem(
+                    path_to_instance,
+                    **PERFORMANCE_SOLVER_PARAMS[instance_type])
             else:
                 for dive in [False]:
                     for cspy in [True]:
@@ -108,7 +116,7 @@ def run_series():
                                 "BestEdges1", "Exact", "Hyper"
                         ]:
                             for greedy in [True, False]:
-                                _run_single_problem(
+                                yield _run_single_problem(
                                     path_to_instance,
                                     dive=dive,
                                     greedy=greedy,
@@ -137,30 +145,33 @@ def run_parallel():
                 [True],  # cspy
                 ["BestEdges1", "Exact"]))
 
-    pool = Pool(processes=CPU_COUNT)
-    with pool:
-        res = pool.map_async(_parallel_wrapper, iterate_over)
-        res.get()
-    pool.close()
+    # Workers only solve, results are streamed to file by the main process
+    with ProcessPoolExecutor(max_workers=CPU_COUNT) as executor:
+        tables = executor.map(_parallel_wrapper, iterate_over, chunksize=4)
+        CsvTable.write_many(table for table in tables if table)
 
 
 def _parallel_wrapper(input_tuple):
     if PERFORMANCE:
         path_to_instance = input_tuple
         instance_type = path_to_instance.parent.stem
-        _run_single_problem(path_to_instance,
-                            **PERFORMANCE_SOLVER_PARAMS[instance_type])
+        return _run_single_problem(path_to_instance,
+                                   **PERFORMANCE_SOLVER_PARAMS[instance_type])
     else:
         kwargs = dict(
             zip([
                 "path_to_instance", "dive", "greedy", "cspy",
                 "pricing_strategy"
             ], input_tuple))
-        _run_single_problem(**kwargs)
+        return _run_single_problem(**kwargs)
 
 
 def _run_single_problem(path_to_instance: Path, **kwargs):
-    'Run single problem with solver arguments as in kwargs'
+    """Run single problem with solver arguments as in kwargs.
+
+    Returns:
+        CsvTable: results of the run, None if the solve failed.
+    """
     instance_folder = path_to_instance.parent
     instance_type = path_to_instance.parent.stem
     instance_name = path_to_instance.name
@@ -176,7 +187,12 @@ def _run_single_problem(path_to_instance: Path, **kwargs):
     prob = VehicleRoutingProblem(data.G,
                                  load_capacity=data.max_load,
                                  time_windows=bool(instance_type == "cvrptw"))
-    prob.solve(**kwargs, compute_runtime=True)
+    try:
+        prob.solve(**kwargs, compute_runtime=True)
+    except Exception as e:
+        # Do not let one failed instance abort the whole run
+        logger.error("Instance %s failed with %r", instance_name, e)
+        return None
     logger.info("keywordargs %s", kwargs)
 
     #send_email("Instance name %s, pricing_strategy" % instance_name)
@@ -185,12 +201,14 @@ def _run_single_problem(path_to_instance: Path, **kwargs):
                      comp_time=prob.comp_time,
                      best_known_solution=data.best_known_solution,
                      instance_type=instance_type)
-    table.from_vrpy_instance(prob)
+    table.set_from_vrpy_instance(prob)
     logger.info("hyperheuristic n_list %s", prob.hyper_heuristic.n)
+    return table
 
 
 def main():
     """ Run parallel or series"""
+    basicConfig(level=INFO)
     if SERIES:
         run_series()
     else:
@@ -48,10 +48,8 @@ class SolomonDataSet:
     def _load(self, path, instance_name, n_vertices=None):
         # Read vehicle capacity
         with open(path / instance_name) as fp:
-            for i, line in enumerate(fp):
-                if i == 4:
-                    self.max_load = int(line.split()[1])
-        fp.close()
+            lines = fp.read().splitlines()
+        self.max_load = int(lines[4].split()[1])
 
         # Create network and store name + capacity
         self.G = DiGraph(
@@ -0,0 +1,13 @@
+from benchmarks.utils.csv_table import CsvTable
+
+
+def test_labels_interned():
+    """Identical labels built at runtime share one object."""
+    tables = [
+        CsvTable(instance_name="P-n16-k8",
+                 pricing_strategy="".join(["Best", "Paths"]),
+                 subproblem_type="".join(["cs", "py"])) for _ in range(2)
+    ]
+    assert tables[0].pricing_strategy == "BestPaths"
+    assert id(tables[0].pricing_strategy) == id(tables[1].pricing_strategy)
+    assert id(tables[0].subproblem_type) == id(tables[1].subproblem_type)
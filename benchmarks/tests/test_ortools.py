@@ -6,9 +6,7 @@ from networkx import (
     compose,
 )
 from numpy import matrix
-import sys
 
-sys.path.append("../vrpy/")
 from vrpy import VehicleRoutingProblem
 from examples.ortools.data import (
     DISTANCES,
@@ -1,10 +1,17 @@
 from pathlib import Path
+from contextlib import ExitStack
 from csv import DictWriter
 from logging import getLogger
+from sys import intern
 
 logger = getLogger(__name__)
 
 
+def _intern(label):
+    """Interns string labels so that identical labels share one object."""
+    return intern(label) if isinstance(label, str) else label
+
+
 class CsvTable:
     """
     Base class for CSVTable.
@@ -20,6 +27,18 @@ class CsvTable:
         dive (bool): Diving heuristic
     Methods:
     """
+    __slots__ = ("path", "instance_name", "instance_type", "comp_time",
+                 "upper_bound", "lower_bound", "integrality_gap",
+                 "optimality_gap", "optimal", "pricing_strategy",
+                 "subproblem_type", "dive", "greedy", "iterations",
+                 "best_known_solution")
+
+    FIELDNAMES = [
+        "Instance", "Pricing strategy", "Subproblem type", "Dived", "Greedy",
+        "Runtime", "# of iterations", "Integrality gap", "Optimality gap",
+        "Optimal"
+    ]
+
     def __init__(self,
                  path=None,
                  instance_name=None,
@@ -46,8 +65,8 @@ class CsvTable:
         self.integrality_gap = integrality_gap
         self.optimality_gap = optimality_gap
         self.optimal = optimal
-        self.pricing_strategy = pricing_strategy
-        self.subproblem_type = subproblem_type
+        self.pricing_strategy = _intern(pricing_strategy)
+        self.subproblem_type = _intern(subproblem_type)
         self.dive = dive
         self.greedy = greedy
         self.iterations = iterations
@@ -59,72 +78,102 @@ class CsvTable:
         """
         Create csv table using a `vrpy.VehicleRoutingProblem` instance
         """
+        self.set_from_vrpy_instance(prob)
+        self.write_to_file(output_folder)
+
+    def set_from_vrpy_instance(self, prob):
+        """
+        Set table values from a `vrpy.VehicleRoutingProblem` instance,
+        without writing them to file.
+        """
         # Extract releavant attributes (most are private)
         self.dive = prob._dive
         self.greedy = prob._greedy
-        self.pricing_strategy = prob._pricing_strategy
+        self.pricing_strategy = _intern(prob._pricing_strategy)
         self.iterations = prob._iteration
         self.subproblem_type = "cspy" if prob._cspy else "lp"
 
-        self.upper_bound = prob.best_value
-        self.lower_bound = prob._lower_bound[-1]
+        upper_bound = prob.best_value
+        lower_bound = prob.lower_bound
+        self.upper_bound = upper_bound
+        self.lower_bound = lower_bound
 
         # Calculate gaps
-        if self.iterations > 1:
-            self.integrality_gap = (self.upper_bound -
-                                    self.lower_bound) / self.lower_bound * 100
+        if self.iterations > 1 and lower_bound is not None:
+            if lower_bound == 0:
+                self.integrality_gap = float("inf")
+            else:
+                self.integrality_gap = (upper_bound -
+                                        lower_bound) / lower_bound * 100
         else:
             self.integrality_gap = "Not-valid"
 
-        if self.best_known_solution is not None:
-            self.optimality_gap = (self.upper_bound - self.best_known_solution
-                                   ) / self.best_known_solution * 100
+        # A best known solution of 0 is treated as missing
+        best_known_solution = self.best_known_solution
+        if best_known_solution:
+            self.optimality_gap = (upper_bound - best_known_solution
+                                   ) / best_known_solution * 100
             self.optimal = (self.optimality_gap == 0)
         else:
             self.optimality_gap = "Unknown"
             self.optimal = "Unknown"
 
-        self.write_to_file(output_folder)
-
     def write_to_file(self, output_folder: str = "benchmarks/results/"):
         """
         Write to file: Creates a results folder in the current directory
         and writes the relevant data to a file specified by instance name.
         """
+        self.write_many([self], output_folder)
+
+    @classmethod
+    def write_many(cls, tables, output_folder: str = "benchmarks/results/"):
+        """
+        Writes several tables at once. Each output file (one per instance
+        type) is opened once and shared by all the rows that go into it.
+        """
         output_folder = Path(output_folder)
         # Create folder if it doesn't already exist
         if not output_folder.exists():
             output_folder.mkdir()
 
+        with ExitStack() as stack:
+            writers = {}
+            for table in tables:
+                if table.instance_type not in writers:
+                    writers[table.instance_type] = cls._open_writer(
+                        stack, output_folder / (table.instance_type + ".csv"))
+                writers[table.instance_type].writerow(table._as_row())
+        for instance_type in writers:
+            logger.info("Results saved to %s",
+                        output_folder / (instance_type + ".csv"))
+
+    @classmethod
+    def _open_writer(cls, stack, output_file_path):
+        """Opens output file in stack and returns a DictWriter on it."""
         # Append to file if it already exists
-        file_name = self.instance_type + ".csv"
-        output_file_path = output_folder / file_name
         mode = 'a' if output_file_path.is_file() else 'w'
-        with open(output_file_path, mode, newline='') as csv_file:
-            writer = DictWriter(csv_file,
-                                fieldnames=[
-                                    "Instance", "Pricing strategy",
-                                    "Subproblem type", "Dived", "Greedy",
-                                    "Runtime", "# of iterations",
-                                    "Integrality gap", "Optimality gap",
-                                    "Optimal"
-                                ])
-            if mode == 'w':
-                writer.writeheader()
-            writer.writerow({
-                "Instance": self.instance_name,
-                "Pricing strategy": self.pricing_strategy,
-                "Subproblem type": self.subproblem_type,
-                "Dived": self.dive,
-                "Greedy": self.greedy,
-                "Runtime": self.comp_time,
-                "# of iterations": self.iterations,
-                "Integrality gap": self.integrality_gap,
-                "Optimality gap": self.optimality_gap,
-                "Optimal": self.optimal
-            })
-        logger.info("Results saved to %s", output_file_path)
-        csv_file.close()
+        # Rows are written sequentially, let the OS flush a large buffer
+        csv_file = stack.enter_context(
+            open(output_file_path, mode, newline='', buffering=1 << 20))
+        writer = DictWriter(csv_file, fieldnames=cls.FIELDNAMES)
+        if mode == 'w':
+            writer.writeheader()
+        return writer
+
+    def _as_row(self):
+        """Returns the attributes to be written as a dict."""
+        return {
+            "Instance": self.instance_name,
+            "Pricing strategy": self.pricing_strategy,
+            "Subproblem type": self.subproblem_type,
+            "Dived": self.dive,
+            "Greedy": self.greedy,
+            "Runtime": self.comp_time,
+            "# of iterations": self.iterations,
+            "Integrality gap": self.integrality_gap,
+            "Optimality gap": self.optimality_gap,
+            "Optimal": self.optimal
+        }
 
     def get_df(self):
         """TODO: write function to get dataframe with only the stuff we want to
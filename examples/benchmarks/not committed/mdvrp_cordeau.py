@@ -2,11 +2,8 @@ from math import sqrt
 from networkx import DiGraph, draw_networkx_edges, draw_networkx_nodes
 import numpy as np
 from pandas import read_csv
-import sys
 import matplotlib.pyplot
 
-sys.path.append("../../")
-sys.path.append("../../../cspy")
 from vrpy.main import VehicleRoutingProblem
 
 import logging
@@ -1,9 +1,7 @@
 from networkx import from_numpy_matrix, relabel_nodes, DiGraph
 from numpy import matrix
 from data import DISTANCES, PICKUPS_DELIVERIES
-import sys
 
-sys.path.append("../../")
 from vrpy import VehicleRoutingProblem
 
 # Transform distance matrix to DiGraph
@@ -8,9 +8,7 @@ from networkx import (
 from numpy import matrix
 
 from data import DISTANCES, TRAVEL_TIMES, TIME_WINDOWS_LOWER, TIME_WINDOWS_UPPER
-import sys
 
-sys.path.append("../../")
 from vrpy import VehicleRoutingProblem
 
 # Transform distance matrix to DiGraph
@@ -0,0 +1,33 @@
+from networkx import DiGraph
+import pytest
+
+
+def _toy_graph(mixed_fleet=False, periodic=False):
+    """Toy graph, optionally with two vehicle types or a periodic node."""
+    G = DiGraph()
+    for v in [1, 2, 3, 4, 5]:
+        G.add_edge("Source", v, cost=10, time=20)
+        G.add_edge(v, "Sink", cost=10, time=20)
+        G.nodes[v]["demand"] = 5
+        G.nodes[v]["upper"] = 100
+        G.nodes[v]["lower"] = 5
+        G.nodes[v]["service_time"] = 1
+    G.nodes[2]["upper"] = 20
+    G.nodes["Sink"]["upper"] = 100
+    G.nodes["Source"]["upper"] = 100
+    G.add_edge(1, 2, cost=10, time=20)
+    G.add_edge(2, 3, cost=10, time=20)
+    G.add_edge(3, 4, cost=15, time=20)
+    G.add_edge(4, 5, cost=10, time=25)
+    if mixed_fleet:
+        for (i, j) in G.edges():
+            G.edges[i, j]["cost"] = 2 * [G.edges[i, j]["cost"]]
+    if periodic:
+        G.nodes[2]["frequency"] = 2
+    return G
+
+
+@pytest.fixture
+def toy_graph():
+    """Returns the function creating a new toy graph."""
+    return _toy_graph
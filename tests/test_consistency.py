@@ -1,6 +1,7 @@
 from networkx import DiGraph, Graph, NetworkXError
 import pytest
 
+from vrpy.checks import check_feasibility
 from vrpy.main import VehicleRoutingProblem
 
 #####################
@@ -44,6 +45,10 @@ def test_check_arguments():
     with pytest.raises(ValueError):
         prob = VehicleRoutingProblem(G)
         prob.solve(pricing_strategy="Best")
+    for value in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            prob = VehicleRoutingProblem(G)
+            prob.solve(exact_escalation_no_improvement=value)
 
 
 def test_consistency_parameters():
@@ -87,3 +92,25 @@ def test_feasibility_check():
     with pytest.raises(ValueError):
         prob = VehicleRoutingProblem(G, duration=1)
         prob.solve()
+
+
+def test_feasibility_check_defaults():
+    """Checks run before the default attributes are set."""
+    G = DiGraph()
+    G.add_edge("Source", 1, cost=1, time=1)
+    G.add_edge(1, "Sink", cost=1)
+    # Missing demand, service time and time read as 0
+    prob = VehicleRoutingProblem(G, load_capacity=1, duration=1)
+    prob.solve()
+    assert prob.best_value == 2
+    # Demand at Source is ignored
+    G.nodes["Source"]["demand"] = 2
+    prob = VehicleRoutingProblem(G, load_capacity=1)
+    prob.solve()
+    assert prob.best_value == 2
+    assert G.nodes["Source"]["demand"] == 0
+    # but not by the deprecated check
+    G.nodes["Source"]["demand"] = 2
+    G.nodes[1]["demand"] = 0
+    with pytest.warns(DeprecationWarning), pytest.raises(ValueError):
+        check_feasibility(load_capacity=[1], G=G)
@@ -0,0 +1,70 @@
+import pytest
+
+from vrpy import VehicleRoutingProblem
+from vrpy.master_solve_pulp import MasterSolvePulp
+
+################################################
+# Persistent master problems vs. pulp's master #
+################################################
+
+# Module needed, solve options and master problem class of each backend
+MIP = ("mip", dict(mip_master=True), "MasterSolveMip")
+GUROBI = ("gurobipy", dict(solver="gurobi"), "MasterSolveGurobi")
+
+SETUPS = [
+    ({}, dict(num_stops=3), {}, 70),
+    ({}, dict(num_stops=3), dict(exact=False), 70),
+    ({}, dict(num_stops=3), dict(greedy=True), 70),
+    ({}, dict(num_stops=3), dict(pricing_strategy="Exact"), 70),
+    ({}, dict(num_stops=3), dict(pricing_strategy="Hyper"), 70),
+    ({}, dict(num_stops=3, load_capacity=10), {}, 80),
+    ({}, dict(num_stops=3,
+              load_capacity=10), dict(pricing_strategy="Hyper"), 80),
+    ({}, dict(num_stops=3, fixed_cost=100), {}, 270),
+    ({}, dict(num_stops=3, num_vehicles=1, drop_penalty=100), {}, 240),
+    ({}, dict(num_stops=3, num_vehicles=1,
+              drop_penalty=100), dict(pricing_strategy="Hyper"), 240),
+    (dict(mixed_fleet=True),
+     dict(load_capacity=[10, 15],
+          fixed_cost=[10, 0],
+          num_vehicles=[5, 1],
+          mixed_fleet=True), {}, 80),
+]
+# The subproblems and schedules of these setups are solved with pulp,
+# through the command line of the solver, only tried with cbc
+CBC_SETUPS = [
+    ({}, dict(num_stops=3), dict(cspy=False), 70),
+    (dict(periodic=True), dict(num_stops=2, periodic=2), {}, 90),
+    (dict(periodic=True), dict(num_stops=2, periodic=2,
+                               num_vehicles=3), {}, 90),
+]
+
+
+@pytest.mark.parametrize(
+    "backend, graph_kwargs, vrp_kwargs, solve_kwargs, best_value",
+    [(backend,) + setup for backend in [MIP, GUROBI] for setup in SETUPS] +
+    [(MIP,) + setup for setup in CBC_SETUPS])
+def test_master_backend(toy_graph, backend, graph_kwargs, vrp_kwargs,
+                        solve_kwargs, best_value):
+    """Tests that the master problem gives the same solution as pulp's."""
+    module, backend_kwargs, class_name = backend
+    pytest.importorskip(module)
+    prob = VehicleRoutingProblem(toy_graph(**graph_kwargs), **vrp_kwargs)
+    prob.solve(**backend_kwargs, **solve_kwargs)
+    assert type(prob.masterproblem).__name__ == class_name
+    assert prob.best_value == best_value
+
+    prob_pulp = VehicleRoutingProblem(toy_graph(**graph_kwargs),
+                                      **vrp_kwargs)
+    prob_pulp.solve(**solve_kwargs)
+    assert isinstance(prob_pulp.masterproblem, MasterSolvePulp)
+    assert prob.best_value == prob_pulp.best_value
+
+
+def test_mip_master_dive(toy_graph):
+    """Diving needs pulp."""
+    pytest.importorskip("mip")
+    prob = VehicleRoutingProblem(toy_graph(), num_stops=3)
+    prob.solve(mip_master=True, dive=True)
+    assert isinstance(prob.masterproblem, MasterSolvePulp)
+    assert prob.best_value == 70
@@ -1,31 +1,19 @@
 from time import time
 
-from networkx import DiGraph
+import pytest
 
 from vrpy import VehicleRoutingProblem
+from vrpy.hyperheuristic import HyperHeuristic
 
 
 class TestsToy:
 
-    def setup(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, toy_graph):
         """
         Creates a toy graph.
         """
-        self.G = DiGraph()
-        for v in [1, 2, 3, 4, 5]:
-            self.G.add_edge("Source", v, cost=10, time=20)
-            self.G.add_edge(v, "Sink", cost=10, time=20)
-            self.G.nodes[v]["demand"] = 5
-            self.G.nodes[v]["upper"] = 100
-            self.G.nodes[v]["lower"] = 5
-            self.G.nodes[v]["service_time"] = 1
-        self.G.nodes[2]["upper"] = 20
-        self.G.nodes["Sink"]["upper"] = 100
-        self.G.nodes["Source"]["upper"] = 100
-        self.G.add_edge(1, 2, cost=10, time=20)
-        self.G.add_edge(2, 3, cost=10, time=20)
-        self.G.add_edge(3, 4, cost=15, time=20)
-        self.G.add_edge(4, 5, cost=10, time=25)
+        self.G = toy_graph()
 
     #################
     # subsolve cspy #
@@ -260,6 +248,15 @@ class TestsToy:
         assert frequency == 2
         assert prob.schedule[0] in [[1], [1, 2]]
 
+    def test_periodic_num_vehicles(self):
+        self.G.nodes[2]["frequency"] = 2
+        prob = VehicleRoutingProblem(self.G,
+                                     num_stops=2,
+                                     periodic=2,
+                                     num_vehicles=3)
+        prob.solve()
+        assert prob.best_value == 90
+
     def test_mixed_fleet(self):
         for (i, j) in self.G.edges():
             self.G.edges[i, j]["cost"] = 2 * [self.G.edges[i, j]["cost"]]
@@ -294,3 +291,90 @@ class TestsToy:
         )
         prob.solve(dive=True)
         assert prob.best_value == 80
+
+    def test_lower_bound(self):
+        prob = VehicleRoutingProblem(self.G, num_stops=3)
+        assert prob.lower_bound is None
+        prob.solve()
+        assert prob.lower_bound <= prob.best_value
+
+    def test_mixed_fleet_parallel_subproblems(self):
+        for (i, j) in self.G.edges():
+            self.G.edges[i, j]["cost"] = 2 * [self.G.edges[i, j]["cost"]]
+        prob = VehicleRoutingProblem(
+            self.G,
+            load_capacity=[10, 15],
+            fixed_cost=[10, 0],
+            num_vehicles=[5, 1],
+            mixed_fleet=True,
+        )
+        prob.solve(parallel_subproblems=True)
+        assert prob.best_value == 80
+        assert set(prob.best_routes_type.values()) == {0, 1}
+
+    def test_parallel_pricing_parameters(self):
+        prob = VehicleRoutingProblem(self.G, num_stops=3)
+        prob.solve(pricing_strategy="BestEdges1", parallel_subproblems=True)
+        assert prob.best_value == 70
+
+    def test_exact_escalation_hyper(self):
+        prob = VehicleRoutingProblem(self.G, num_stops=3)
+        prob.hyper_heuristic = HyperHeuristic(
+            performance_measure="Relative improvement")
+        prob.solve(pricing_strategy="Hyper")
+        assert prob.best_value == 70
+        assert prob.do_exact == 30
+        # The value given by the user is kept
+        prob.hyper_heuristic = HyperHeuristic(
+            performance_measure="Relative improvement")
+        prob.solve(pricing_strategy="Hyper",
+                   exact_escalation_no_improvement=5)
+        assert prob.best_value == 70
+        assert prob.do_exact == 5
+
+    def test_hyper_heuristic_exact_check(self):
+        """A heuristic that finds no column is followed by exact pricing,
+        even if cspy's exact algorithm is not used."""
+        prob = VehicleRoutingProblem(self.G, num_stops=3)
+        prob.solve(pricing_strategy="Hyper", exact=False)
+        assert prob.best_value == 70
+        exact_calls = []
+        prob._attempt_solve = lambda *args, **kwargs: False
+        prob._attempt_solve_Exact = (
+            lambda *args, **kwargs: exact_calls.append(kwargs) or False)
+        n_exact = prob.hyper_heuristic.n_exact
+        assert not prob._solve_subproblem_with_heuristic(
+            pricing_strategy="BestEdges1")
+        assert len(exact_calls) == 1
+        assert prob.hyper_heuristic.n_exact == n_exact + 1
+
+    def test_prune_resolve(self):
+        prob = VehicleRoutingProblem(self.G, num_stops=3, load_capacity=10)
+        pruned = []
+        remove_arcs = prob._remove_infeasible_arcs_capacities
+        prob._remove_infeasible_arcs_capacities = lambda: pruned.append(
+            remove_arcs())
+        prob.solve()
+        assert prob.best_value == 80
+        assert (2, 3) in prob.G.edges()
+        assert len(pruned) == 1
+        # Not pruned again on the next solves
+        self.G.nodes[3]["demand"] = 10
+        prob.solve()
+        prob.solve()
+        assert len(pruned) == 1
+        assert (2, 3) in prob.G.edges()
+        # Unless asked to
+        prob.invalidate_prune()
+        prob.solve()
+        assert len(pruned) == 2
+        assert (2, 3) not in prob.G.edges()
+        assert prob.best_value == 80
+
+    def test_fixed_cost_resolve(self):
+        prob = VehicleRoutingProblem(self.G, num_stops=3, fixed_cost=100)
+        prob.solve()
+        assert prob.best_value == 270
+        prob.solve()
+        assert prob.best_value == 270
+        assert prob.G.edges["Source", 1]["cost"] == [110]
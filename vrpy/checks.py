@@ -1,6 +1,7 @@
 """Functions to check input types and consistency.
 """
 import logging
+import warnings
 
 from networkx import DiGraph, NetworkXError, has_path
 
@@ -16,7 +17,24 @@ def check_arguments(num_stops: int = None,
                     G: DiGraph = None,
                     vehicle_types: int = None,
                     num_vehicles: list = None):
-    """Checks if arguments are consistent."""
+    """Checks if arguments are consistent.
+
+    Deprecated, use `check_all` instead.
+    """
+    warnings.warn("check_arguments is deprecated, use check_all instead.",
+                  DeprecationWarning)
+    _check_argument_values(num_stops, load_capacity, duration,
+                           pricing_strategy, mixed_fleet, fixed_cost,
+                           num_vehicles)
+    if mixed_fleet:
+        for (i, j) in G.edges():
+            _check_edge_cost(i, j, G.edges[i, j], vehicle_types)
+
+
+def _check_argument_values(num_stops, load_capacity, duration,
+                           pricing_strategy, mixed_fleet, fixed_cost,
+                           num_vehicles):
+    """Checks if arguments that do not depend on the graph are consistent."""
 
     # If num_stops/load_capacity/duration are not integers
     if num_stops and (not isinstance(num_stops, int) or num_stops <= 0):
@@ -48,14 +66,17 @@ def check_arguments(num_stops: int = None,
             raise ValueError(
                 "Input arguments num_vehicles and fixed_cost must have same dimension."
             )
-        for (i, j) in G.edges():
-            if not isinstance(G.edges[i, j]["cost"], list):
-                raise TypeError(
-                    "Cost attribute for edge (%s,%s) should be of type list")
-            if len(G.edges[i, j]["cost"]) != vehicle_types:
-                raise ValueError(
-                    "Cost attribute for edge (%s,%s) has dimension %s, should have dimension %s."
-                    % (i, j, len(G.edges[i, j]["cost"]), vehicle_types))
+
+
+def _check_edge_cost(i, j, data, vehicle_types):
+    """Checks the cost attribute of edge (i,j) with a mixed fleet."""
+    if not isinstance(data["cost"], list):
+        raise TypeError(
+            "Cost attribute for edge (%s,%s) should be of type list")
+    if len(data["cost"]) != vehicle_types:
+        raise ValueError(
+            "Cost attribute for edge (%s,%s) has dimension %s, should have dimension %s."
+            % (i, j, len(data["cost"]), vehicle_types))
 
 
 def check_vrp(G: DiGraph = None):
@@ -131,7 +152,23 @@ def check_consistency(cspy: bool = None,
                       pickup_delivery: bool = None,
                       pricing_strategy: str = None,
                       G: DiGraph = None):
-    """Raises errors if options are inconsistent with parameters."""
+    """Raises errors if options are inconsistent with parameters.
+
+    Deprecated, use `check_all` instead.
+    """
+    warnings.warn("check_consistency is deprecated, use check_all instead.",
+                  DeprecationWarning)
+    _check_option_values(cspy, pickup_delivery, pricing_strategy)
+    # pickup delivery expects at least one request
+    if pickup_delivery:
+        request = any("request" in G.nodes[v] for v in G.nodes())
+        if not request:
+            raise KeyError(
+                "pickup_delivery option expects at least one request.")
+
+
+def _check_option_values(cspy, pickup_delivery, pricing_strategy):
+    """Raises errors if solving options are inconsistent."""
 
     # pickup delivery requires cspy=False
     if cspy and pickup_delivery:
@@ -141,32 +178,74 @@ def check_consistency(cspy: bool = None,
     if pickup_delivery and pricing_strategy != "Exact":
         pricing_strategy = "Exact"
         logger.warning("Pricing_strategy changed to 'Exact'.")
-    # pickup delivery expects at least one request
-    if pickup_delivery:
-        request = any("request" in G.nodes[v] for v in G.nodes())
-        if not request:
-            raise KeyError(
-                "pickup_delivery option expects at least one request.")
 
 
 def check_feasibility(load_capacity: list = None,
                       G: DiGraph = None,
                       duration: int = None):
-    """Checks basic problem feasibility."""
+    """Checks basic problem feasibility.
 
-    if load_capacity:
-        for v in G.nodes():
-            if G.nodes[v]["demand"] > max(load_capacity):
-                raise ValueError(
-                    "Demand %s at node %s larger than max capacity %s." %
-                    (G.nodes[v]["demand"], v, max(load_capacity)))
-    if duration:
-        for v in G.nodes():
-            if v not in ["Source", "Sink"]:
-                round_trip_duration = (G.nodes[v]["service_time"] +
-                                       G.edges["Source", v]["time"] +
-                                       G.edges[v, "Sink"]["time"])
-                if round_trip_duration > duration:
-                    raise ValueError(
-                        "Node %s not reachable: duration of path [Source,%s,Sink], %s, is larger than max duration %s."
-                        % (v, v, round_trip_duration, duration))
+    Deprecated, use `check_all` instead.
+    """
+    warnings.warn("check_feasibility is deprecated, use check_all instead.",
+                  DeprecationWarning)
+    max_capacity = max(load_capacity) if load_capacity else None
+    for v in G.nodes():
+        _check_node_feasibility(G, v, G.nodes[v], max_capacity, duration)
+
+
+def _check_node_feasibility(G, v, data, max_capacity, duration):
+    """Checks that node v can be visited by a round trip."""
+    if max_capacity and data.get("demand", 0) > max_capacity:
+        raise ValueError("Demand %s at node %s larger than max capacity %s." %
+                         (data["demand"], v, max_capacity))
+    if duration and v not in ["Source", "Sink"]:
+        round_trip_duration = (data.get("service_time", 0) +
+                               G.edges["Source", v].get("time", 0) +
+                               G.edges[v, "Sink"].get("time", 0))
+        if round_trip_duration > duration:
+            raise ValueError(
+                "Node %s not reachable: duration of path [Source,%s,Sink], %s, is larger than max duration %s."
+                % (v, v, round_trip_duration, duration))
+
+
+def check_all(G: DiGraph = None,
+              num_stops: int = None,
+              load_capacity: list = None,
+              duration: int = None,
+              pricing_strategy: str = None,
+              mixed_fleet: bool = None,
+              fixed_cost: bool = None,
+              vehicle_types: int = None,
+              num_vehicles: list = None,
+              cspy: bool = None,
+              pickup_delivery: bool = None,
+              exact_escalation_no_improvement: int = None):
+    """
+    Checks arguments, options consistency and basic feasibility
+    with a single pass over the edges and a single pass over the nodes.
+    Called before the default attributes are set, missing attributes
+    are read as 0.
+    """
+    _check_argument_values(num_stops, load_capacity, duration,
+                           pricing_strategy, mixed_fleet, fixed_cost,
+                           num_vehicles)
+    _check_option_values(cspy, pickup_delivery, pricing_strategy)
+    if exact_escalation_no_improvement is not None and (
+            not isinstance(exact_escalation_no_improvement, int)
+            or exact_escalation_no_improvement < 1):
+        raise ValueError(
+            "exact_escalation_no_improvement must be an integer >= 1.")
+    if mixed_fleet:
+        for i, j, data in G.edges(data=True):
+            _check_edge_cost(i, j, data, vehicle_types)
+    max_capacity = max(load_capacity) if load_capacity else None
+    request = False
+    for v, data in G.nodes(data=True):
+        request = request or "request" in data
+        # Demand at Source/Sink is set to 0 with the default attributes
+        if v not in ["Source", "Sink"]:
+            _check_node_feasibility(G, v, data, max_capacity, duration)
+    # pickup delivery expects at least one request
+    if pickup_delivery and not request:
+        raise KeyError("pickup_delivery option expects at least one request.")
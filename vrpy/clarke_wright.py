@@ -1,4 +1,7 @@
-from networkx import DiGraph, add_path, shortest_path
+from networkx import DiGraph, add_path
+from numpy import argsort, array
+
+from vrpy.utils import walk
 
 
 class ClarkeWright:
@@ -10,6 +13,9 @@ class ClarkeWright:
         load_capacity (int, optional) : Maximum load per route. Defaults to None.
         duration (int, optional) : Maximum duration per route. Defaults to None.
         num_stops (int, optional) : Maximum number of stops per route. Defaults to None.
+        precomputed (dict, optional) :
+            Output of `ClarkeWright.precompute(G)`, shared by runs with different alphas.
+            Defaults to None.
     """
     def __init__(
         self,
@@ -20,9 +26,13 @@ class ClarkeWright:
         alpha=1,
         beta=0,
         gamma=0,
+        precomputed=None,
     ):
-        self.G = G.copy()
-        self._format_cost()
+        if not precomputed:
+            precomputed = self.precompute(G)
+        # The graph is only read, it can be shared
+        self.G = precomputed["G"]
+        self._precomputed = precomputed
         self._savings = {}
         self._ordered_edges = []
         self._route = {}
@@ -79,29 +89,48 @@ class ClarkeWright:
         self._best_value = 0
         for route in list(set(self._route.values())):
             self._best_value += route.graph["cost"]
-            self._best_routes.append(shortest_path(route, "Source", "Sink"))
+            self._best_routes.append(walk(route))
+
+    @staticmethod
+    def precompute(G):
+        """
+        Returns the data shared by runs with different alphas:
+        a copy of G with formatted costs, its candidate edges for merging, and
+        the parts of their savings that do not depend on alpha.
+        """
+        G = G.copy()
+        ClarkeWright._format_cost(G)
+        edges = [(i, j) for (i, j) in G.edges() if i != "Source" and j != "Sink"]
+        # Saving of edge (i,j) is c_iSink + c_Sourcej - alpha * c_ij
+        return {
+            "G": G,
+            "edges": edges,
+            "depot_cost": array([
+                G.edges[i, "Sink"]["cost"] + G.edges["Source", j]["cost"]
+                for (i, j) in edges
+            ]),
+            "cost": array([G.edges[i, j]["cost"] for (i, j) in edges]),
+        }
 
     def _get_savings(self):
         """Computes Clark & Wright savings and orders edges by non increasing savings."""
-        for (i, j) in self.G.edges():
-            if i != "Source" and j != "Sink":
-                self._savings[(i, j)] = (
-                    self.G.edges[i, "Sink"]["cost"] +
-                    self.G.edges["Source", j]["cost"] -
-                    self.alpha * self.G.edges[i, j]["cost"]
-                    # FOR MORE SOPHISTICATED VERSIONS OF CLARKE WRIGHT:
-                    # + self.beta
-                    # * abs(
-                    #    self.G.edges["Source", i]["cost"]
-                    #    - self.G.edges[j, "Sink"]["cost"]
-                    # )
-                    # + self.gamma
-                    # * (self.G.nodes[i]["demand"] + self.G.nodes[j]["demand"])
-                    # / self._average_demand
-                )
-        self._ordered_edges = sorted(self._savings,
-                                     key=self._savings.get,
-                                     reverse=True)
+        edges = self._precomputed["edges"]
+        savings = (self._precomputed["depot_cost"] -
+                   self.alpha * self._precomputed["cost"])
+        # FOR MORE SOPHISTICATED VERSIONS OF CLARKE WRIGHT:
+        # + self.beta
+        # * abs(
+        #    self.G.edges["Source", i]["cost"]
+        #    - self.G.edges[j, "Sink"]["cost"]
+        # )
+        # + self.gamma
+        # * (self.G.nodes[i]["demand"] + self.G.nodes[j]["demand"])
+        # / self._average_demand
+        self._savings = dict(zip(edges, savings.tolist()))
+        # Stable sort, edges with equal savings keep the order of G
+        self._ordered_edges = [
+            edges[k] for k in argsort(-savings, kind="stable")
+        ]
 
     def _merge_route(self, existing_node, new_node, depot):
         """
@@ -205,11 +234,12 @@ class ClarkeWright:
             ):
             self._merge_route(j, i, "Source")
 
-    def _format_cost(self):
+    @staticmethod
+    def _format_cost(G):
         """If list of costs is given, first item of list is considered."""
-        for (i, j) in self.G.edges():
-            if isinstance(self.G.edges[i, j]["cost"], list):
-                self.G.edges[i, j]["cost"] = self.G.edges[i, j]["cost"][0]
+        for (i, j) in G.edges():
+            if isinstance(G.edges[i, j]["cost"], list):
+                G.edges[i, j]["cost"] = G.edges[i, j]["cost"][0]
 
     @property
     def best_value(self):
@@ -1,13 +1,12 @@
 from random import uniform, choice
 from math import exp, log, sqrt
-from time import time
+from time import perf_counter
 import json
 #from .main import VehicleRoutingProblem
 import logging
 import bisect
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 class HyperHeuristic:
@@ -112,7 +111,7 @@ class HyperHeuristic:
         self.current_objective_value = objective
 
     def set_initial_time(self):
-        self.timeend = time()
+        self.timeend = perf_counter()
 
     def pick_heurestic(self, heuristic: int = None):
         """
@@ -153,7 +152,7 @@ class HyperHeuristic:
     def _compute_last_runtime(self):
         #   computes last time
         self.timestart = self.timeend
-        self.timeend = time()
+        self.timeend = perf_counter()
         self.last_runtime = self.timeend - self.timestart
 
     def _current_performance_relimp(self, produced_column: bool = False):
@@ -1,24 +1,45 @@
 import logging
-from time import time
+from bisect import bisect_right
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, wraps
+from itertools import accumulate
+from os import cpu_count
+from time import perf_counter
 from pathlib import Path
+from pickle import dumps, loads
 
-from networkx import DiGraph, shortest_path  #draw_networkx
+from networkx import DiGraph
+from numpy import argwhere, array
 
 from vrpy.greedy import Greedy
 from vrpy.master_solve_pulp import MasterSolvePulp
 from vrpy.subproblem_lp import SubProblemLP
-from vrpy.subproblem_cspy import SubProblemCSPY
 from vrpy.subproblem_greedy import SubProblemGreedy
 from vrpy.clarke_wright import ClarkeWright, RoundTrip
 from vrpy.schedule import Schedule
-from vrpy.checks import (check_arguments, check_consistency, check_feasibility,
-                         check_initial_routes, check_vrp)
+from vrpy.checks import check_all, check_initial_routes, check_vrp
+from vrpy.utils import walk
 from .hyperheuristic import HyperHeuristic
-from csv import DictWriter
+from csv import writer
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.INFO)
+
+def _solution_property(method):
+    """
+    Property of the best routes, computed once per solution.
+    The cache is reset when the best routes are set.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def cached(self):
+        if name not in self._solution_cache:
+            self._solution_cache[name] = method(self)
+        return self._solution_cache[name]
+
+    return property(cached)
 
 
 class VehicleRoutingProblem:
@@ -62,6 +83,28 @@ class VehicleRoutingProblem:
             True if heterogeneous fleet.
             Defaluts to False.
     """
+    # Parameters tried in turn by the heuristic pricing strategies
+    _pricing_parameters = {
+        "BestPaths": [3, 5, 7, 9],  # number of shortest paths
+        "BestEdges1": [0.3, 0.5, 0.7, 0.9],  # alpha
+        "BestEdges2": [0.1, 0.2, 0.3],  # ratio
+    }
+    # Attributes read to solve a subproblem in another process
+    _subproblem_attributes = (
+        "G",
+        "num_stops",
+        "load_capacity",
+        "duration",
+        "time_windows",
+        "pickup_delivery",
+        "distribution_collection",
+        "_cspy",
+        "_exact",
+        "_solver",
+        "_pricing_strategy",
+        "_time_limit",
+    )
+
     def __init__(self,
                  G,
                  num_stops=None,
@@ -94,26 +137,51 @@ class VehicleRoutingProblem:
 
         self.routes = []
         self._solver = None
+        self._mip_master = False
         self._time_limit = None
         self._pricing_strategy = None
         self._exact = None
         self._cspy = None
         self._dive = None
         self._start_time = None
+        self._deadline = None
         self._greedy = None
         self._max_iter = None
+        self._parallel_subproblems = False
+        self._executor = None
+        self._n_workers = None
+        # Run info file (hyper heuristic)
+        self._info_csv_file = None
+        self._info_csv_writer = None
+        self._info_rows_buffer = []
+        # Subproblems that can be reused from one iteration to the next
+        self._subproblem_cache = {}
+        # Number of routes already checked against the master problem
+        self._routes_processed_len = 0
+        # Number of nodes after pre-processing
+        self._n_nodes = None
         # parameters for column generation stopping criteria
         self._more_routes = None
         self._iteration = 0
         self._no_improvement = 0
-        self._lower_bound = []
+        # Only the most recent relaxed objective values are kept
+        self._lower_bound = deque(maxlen=1024)
         # Parameters for initial solution
         self._initial_routes = []
+        self._initial_routes_given = False
         self._preassignments = []
         # Parameters for final solution
         self._best_value = None
         self._best_routes = []
+        # Solution properties already computed for the best routes
+        self._solution_cache = {}
         self._best_routes_as_graphs = []
+        # Missing node attributes have been set to their defaults
+        self._attrs_initialized = False
+        # The graph has been pruned by a previous solve
+        self._pruned = False
+        # Costs of the edges from Source that include the fixed costs
+        self._fixed_costs_added = {}
         # Check if given inputs are consistent
         check_vrp(self.G)
 
@@ -127,8 +195,13 @@ class VehicleRoutingProblem:
         self.use_hyper_heuristic = use_hyper_heuristic
         self.produced_column = None
 
-        #number of iterations before exact is tried
-        self.do_exact = 1000
+        #number of iterations without improvement before exact is tried
+        self.do_exact = 50
+        # Tailing off detection
+        self._tailing_off_window = 20
+        self._tailing_off_tol = 1e-6
+        # do_exact was given by the user
+        self._do_exact_given = False
 
     def solve(self,
               initial_routes=None,
@@ -142,9 +215,17 @@ class VehicleRoutingProblem:
               greedy=False,
               max_iter=None,
               compute_runtime=False,
-              use_hyper_heuristic=True):
+              use_hyper_heuristic=True,
+              parallel_subproblems=False,
+              tailing_off_window=20,
+              tailing_off_tol=1e-6,
+              exact_escalation_no_improvement=None,
+              mip_master=False):
         """Iteratively generates columns with negative reduced cost and solves as MIP.
 
+        The graph is preprocessed on the first call only. If G is modified
+        between two calls, call invalidate_prune() before solving again.
+
         Args:
             initial_routes (list, optional):
                 List of routes (ordered list of nodes).
@@ -178,6 +259,8 @@ class VehicleRoutingProblem:
                 Three options available: "cbc", "cplex", "gurobi".
                 Using "cplex" or "gurobi" requires installation. Not available by default.
                 Additionally, "gurobi" requires pulp to be installed from source.
+                With "gurobi", the master problem is kept in a gurobipy model
+                across iterations, unless dive is True.
                 Defaults to "cbc", available by default.
             dive (bool, optional):
                 True if diving heuristic is used.
@@ -192,6 +275,32 @@ class VehicleRoutingProblem:
             use_hyper_heuristic (bool, optional):
                 True if hyper_heuristic is to be employed
                 Defaults to True 
+            parallel_subproblems (bool, optional):
+                True if the subproblems of the different vehicle types
+                (mixed fleet), or else the parameters of the heuristic
+                pricing strategies, are solved in parallel processes.
+                The Clarke & Wright runs of the initial solution are
+                also run in parallel.
+                Defaults to False.
+            tailing_off_window (int, optional):
+                Number of iterations over which the relative improvement
+                of the relaxed objective is measured.
+                Defaults to 20.
+            tailing_off_tol (float, optional):
+                Relative improvement below which the exact pricing
+                strategy is used.
+                Defaults to 1e-6.
+            exact_escalation_no_improvement (int, optional):
+                Number of iterations without improvement after which the
+                exact pricing strategy is used.
+                Defaults to 50 (30 with the "Relative improvement"
+                performance measure of the hyper-heuristic).
+            mip_master (bool, optional):
+                True if the master problem is kept in a python-mip model
+                across iterations, which calls cbc in-process.
+                Requires python-mip. Only used with solver "cbc" and
+                without diving.
+                Defaults to False.
 
         Returns:
             float: Optimal solution of MIP based on generated columns
@@ -200,11 +309,12 @@ class VehicleRoutingProblem:
         self.use_hyper_heuristic = use_hyper_heuristic
 
         # compute run time
-        self.starttime = time()
+        self.starttime = perf_counter()
 
         # set solving attributes
         self._more_routes = True
         self._solver = solver
+        self._mip_master = mip_master
         self._time_limit = time_limit
         self._pricing_strategy = pricing_strategy
         self._exact = exact
@@ -212,11 +322,21 @@ class VehicleRoutingProblem:
         self._dive = False
         self._greedy = greedy
         self._max_iter = max_iter
-        self._start_time = time()
+        self._parallel_subproblems = parallel_subproblems
+        self._tailing_off_window = tailing_off_window
+        self._tailing_off_tol = tailing_off_tol
+        self._do_exact_given = exact_escalation_no_improvement is not None
+        self.do_exact = (exact_escalation_no_improvement
+                         if self._do_exact_given else 50)
+        self._no_improvement = 0
+        self._start_time = perf_counter()
+        if time_limit:
+            self._deadline = self._start_time + time_limit
         if preassignments:
             self._preassignments = preassignments
         if initial_routes:
             self._initial_routes = initial_routes
+        self._initial_routes_given = bool(initial_routes)
 
         # If only one type of vehicle, some formatting is done
         if not self.mixed_fleet:
@@ -226,20 +346,27 @@ class VehicleRoutingProblem:
         self._pre_solve()
 
         # Initialization
-        self._initialize(solver)
-
-        # Column generation
-        self._column_generation()
+        self._initialize(solver, dive)
 
-        if dive:
-            self._dive = True
-            self._more_routes = True
-            # Initialization
+        try:
+            # Column generation
             self._column_generation()
 
+            if dive:
+                self._dive = True
+                self._more_routes = True
+                # Initialization
+                self._column_generation()
+        finally:
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+            self._close_info_csv()
+
+        if dive:
             self._best_value, self._best_routes_as_graphs = \
                     self.masterproblem.get_total_cost_and_routes(relax=True)
-        elif len(self.G.nodes()) > 2:
+        elif self._n_nodes > 2:
             # Solve as MIP
             _, _ = self.masterproblem.solve(
                 relax=False, time_limit=self._get_time_remaining(mip=True))
@@ -265,54 +392,67 @@ class VehicleRoutingProblem:
             self._schedule = schedule.routes_per_day
 
         #sets the comp_time
-        self.endtime = time()
+        self.endtime = perf_counter()
         self.comp_time = self.endtime - self.starttime
         #print(self.comp_time)
 
     def _column_generation(self):
+        find_columns = self._find_columns
+        get_time_remaining = self._get_time_remaining
+        max_iter = self._max_iter
+        has_time_limit = bool(self._time_limit)
         while self._more_routes:
             # Generate good columns
-            self._find_columns()
+            find_columns()
             # Stop if time limit is passed
-            if isinstance(self._get_time_remaining(),
-                          float) and self._get_time_remaining() == 0.0:
+            if has_time_limit and get_time_remaining() == 0.0:
                 logger.info("time up !")
                 break
             # Stop if no improvement limit is passed or max iter exceeded
-            if self._no_improvement > 1000 or (
-                    self._max_iter and self._iteration >= self._max_iter):
+            if self._no_improvement > 1000 or (max_iter and
+                                               self._iteration >= max_iter):
                 break
 
+    def _is_tailing_off(self):
+        """
+        Returns True if the relative improvement of the relaxed objective
+        over the last `tailing_off_window` iterations is below tolerance.
+        """
+        k = self._tailing_off_window
+        if not k or len(self._lower_bound) < k:
+            return False
+        relative_gap = abs(self._lower_bound[-1] - self._lower_bound[-k]) / max(
+            1, abs(self._lower_bound[-1]))
+        return relative_gap < self._tailing_off_tol
+
     def _pre_solve(self):
         """Some pre-processing."""
+        # If G is preprocessed again, the routes of the previous solve may
+        # have become infeasible
+        if not self._pruned and not self._initial_routes_given:
+            self._initial_routes = []
         if self.mixed_fleet:
             self._define_vehicle_types()
         else:
             self._vehicle_types = 1
-        # Consistency checks
-        check_arguments(num_stops=self.num_stops,
-                        load_capacity=self.load_capacity,
-                        duration=self.duration,
-                        pricing_strategy=self._pricing_strategy,
-                        mixed_fleet=self.mixed_fleet,
-                        fixed_cost=self.fixed_cost,
-                        G=self.G,
-                        vehicle_types=self._vehicle_types,
-                        num_vehicles=self.num_vehicles)
+        # Consistency and feasibility checks
+        check_all(G=self.G,
+                  num_stops=self.num_stops,
+                  load_capacity=self.load_capacity,
+                  duration=self.duration,
+                  pricing_strategy=self._pricing_strategy,
+                  mixed_fleet=self.mixed_fleet,
+                  fixed_cost=self.fixed_cost,
+                  vehicle_types=self._vehicle_types,
+                  num_vehicles=self.num_vehicles,
+                  cspy=self._cspy,
+                  pickup_delivery=self.pickup_delivery,
+                  exact_escalation_no_improvement=self.do_exact)
         # Setup fixed costs
         if self.fixed_cost:
             self._add_fixed_costs()
         # Setup default attributes if missing
         self._update_dummy_attributes()
-        # Check options consistency
-        check_consistency(cspy=self._cspy,
-                          pickup_delivery=self.pickup_delivery,
-                          pricing_strategy=self._pricing_strategy,
-                          G=self.G)
-        # Check feasibility
-        check_feasibility(load_capacity=self.load_capacity,
-                          G=self.G,
-                          duration=self.duration)
         # Lock preassigned routes
         if self._preassignments:
             self._lock()
@@ -321,8 +461,10 @@ class VehicleRoutingProblem:
         # Compute upper bound on number of stops as knapsack problem
         if self.load_capacity and not self.pickup_delivery:
             self._get_num_stops_upper_bound(self._max_capacity)
+        # The nodes of G do not change from here on
+        self._n_nodes = self.G.number_of_nodes()
 
-    def _initialize(self, solver):
+    def _initialize(self, solver, dive=False):
         """Initialization with feasible solution."""
         if self._initial_routes:
             # Initial solution is given as input
@@ -332,8 +474,19 @@ class VehicleRoutingProblem:
             self._get_initial_solution()
         # Initial routes are converted to digraphs
         self._convert_initial_routes_to_digraphs()
+        # Cached subproblems point to the previous routes
+        self._subproblem_cache = {}
+        self._routes_processed_len = 0
         # Init master problem
-        self.masterproblem = MasterSolvePulp(
+        master_solve = MasterSolvePulp
+        # Persistent models (diving needs pulp), only imported when needed
+        if solver == "gurobi" and not dive:
+            from vrpy.master_solve_gurobi import MasterSolveGurobi
+            master_solve = MasterSolveGurobi
+        elif solver == "cbc" and self._mip_master and not dive:
+            from vrpy.master_solve_mip import MasterSolveMip
+            master_solve = MasterSolveMip
+        self.masterproblem = master_solve(
             self.G,
             self._routes_with_node,
             self._routes,
@@ -343,38 +496,21 @@ class VehicleRoutingProblem:
             solver,
         )
 
-    def _attempt_solve_best_paths(self,
-                                  pricing_strategy=None,
-                                  vehicle=None,
-                                  duals=None):
-        produced_column = False
-        for k_shortest_paths in [3, 5, 7, 9]:
-            subproblem = self._def_subproblem(
-                duals,
-                vehicle,
-                "BestPaths",
-                k_shortest_paths,
-            )
-            self.routes, self._more_routes = subproblem.solve(
-                self._get_time_remaining())
-            produced_column = self._more_routes
-            if self._more_routes:
-                break
-        else:
-            self._more_routes = True
-        return produced_column
-
-    def _attempt_solve_BestEdges1(self,
-                                  pricing_strategy=None,
-                                  vehicle=None,
-                                  duals=None):
+    def _attempt_solve(self, pricing_strategy, vehicle=None, duals=None):
+        """
+        Solves the pricing problem with a heuristic pricing strategy,
+        trying its parameters in turn until a column is produced.
+        """
+        if self._parallel_subproblems:
+            return self._attempt_solve_in_parallel(pricing_strategy, vehicle,
+                                                   duals)
         produced_column = False
-        for alpha in [0.3, 0.5, 0.7, 0.9]:
+        for pricing_parameter in self._pricing_parameters[pricing_strategy]:
             subproblem = self._def_subproblem(
                 duals,
                 vehicle,
-                "BestEdges1",
-                alpha,
+                pricing_strategy,
+                pricing_parameter,
             )
             self.routes, self._more_routes = subproblem.solve(
                 self._get_time_remaining(),
@@ -383,33 +519,35 @@ class VehicleRoutingProblem:
             produced_column = self._more_routes
             if self._more_routes:
                 break
-        else:
-            self._more_routes = True
         return produced_column
 
-    def _attempt_solve_BestEdges2(self,
-                                  pricing_strategy=None,
-                                  vehicle=None,
-                                  duals=None):
-        produced_column = False
-        for ratio in [0.1, 0.2, 0.3]:
-            subproblem = self._def_subproblem(
-                duals,
-                vehicle,
-                "BestEdges2",
-                ratio,
-            )
-            self.routes, self._more_routes = subproblem.solve(
-                self._get_time_remaining(),
-                # exact=False,
-            )
-            produced_column = self._more_routes
-            if self._more_routes:
+    def _attempt_solve_in_parallel(self, pricing_strategy, vehicle, duals):
+        """
+        Solves the pricing problem with all parameters of a heuristic pricing
+        strategy at once in parallel processes. The column of the first
+        parameter (in order) that produces one is kept.
+        The copy of the problem is pickled once for all parameters.
+        """
+        executor = self._get_executor()
+        vrp = dumps(self._copy_for_subproblem())
+        futures = [
+            executor.submit(_solve_pricing_parameter_in_worker, vrp,
+                            pricing_strategy, pricing_parameter, vehicle,
+                            duals)
+            for pricing_parameter in self._pricing_parameters[pricing_strategy]
+        ]
+        self._more_routes = False
+        for future in futures:
+            new_routes, more_routes = future.result()
+            if more_routes:
+                self._more_routes = True
+                self._add_worker_routes(new_routes)
                 break
-        else:
-            self._more_routes = True
-
-        return produced_column
+        # Results of the remaining parameters are not needed
+        for future in futures:
+            future.cancel()
+        self.routes = self._routes
+        return self._more_routes
 
     def _attempt_solve_Exact(self,
                              pricing_strategy=None,
@@ -428,63 +566,24 @@ class VehicleRoutingProblem:
                                          pricing_strategy=None,
                                          vehicle=None,
                                          duals=None):
-        """Solves pricing problem with input heuristic
         """
-        """TODO: Jeg får flere paths enn én! Hvordan skal jeg håndtere det?"""
-        """Påstand: Hvis prisheurestikkene ikke gir en kolonne med reduced cost -> termineringskriterium"""
-        """TODO: change to if (self._no_improvement >= K and not self._more_routes and self.exact) or pricing_strategy == "Exact":"""
+        Solves pricing problem with input heuristic.
+        If the heuristic gives up, the exact pricing problem is solved,
+        so that column generation only stops when no column exists.
+        """
         produced_column = False
-        if self._pricing_strategy == "Hyper":
-            if pricing_strategy == "BestPaths":
-                produced_column = self._attempt_solve_best_paths(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            elif pricing_strategy == "BestEdges1":
-                produced_column = self._attempt_solve_BestEdges1(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            elif pricing_strategy == "BestEdges2":
-                produced_column = self._attempt_solve_BestEdges2(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            elif pricing_strategy == "Exact":
-                #self._no_improvement = 0  #Fudge solution
+        if pricing_strategy in self._pricing_parameters:
+            produced_column = self._attempt_solve(pricing_strategy,
+                                                  vehicle=vehicle,
+                                                  duals=duals)
+        # Heuristic gave up, certify with exact pricing
+        if pricing_strategy == "Exact" or not produced_column:
+            if self._pricing_strategy == "Hyper":
                 self.hyper_heuristic.n_exact += 1
-                produced_column = self._attempt_solve_Exact(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-        else:  #old approach
-            if pricing_strategy == "BestPaths":
-                produced_column = self._attempt_solve_best_paths(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            elif pricing_strategy == "BestEdges1":
-                produced_column = self._attempt_solve_BestEdges1(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            elif pricing_strategy == "BestEdges2":
-                produced_column = self._attempt_solve_BestEdges2(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
-
-            if pricing_strategy == "Exact" or not produced_column:
-                produced_column = self._attempt_solve_Exact(
-                    pricing_strategy=pricing_strategy,
-                    vehicle=vehicle,
-                    duals=duals)
+            produced_column = self._attempt_solve_Exact(
+                pricing_strategy=pricing_strategy,
+                vehicle=vehicle,
+                duals=duals)
         return produced_column
 
     def store_info_heuristic(self,
@@ -494,163 +593,173 @@ class VehicleRoutingProblem:
                              output_folder="benchmarks/results/instances"):
         """Store data from a run to output_folder, defaults to "benchmarks/results/instances
         """
-
+        self._info_rows_buffer.append([
+            self._iteration,
+            relaxed_cost,
+            self.hyper_heuristic.n[0],
+            self.hyper_heuristic.n[1],
+            self.hyper_heuristic.n[2],
+            self.hyper_heuristic.n[3],
+            self.hyper_heuristic.average_runtime,
+            self.hyper_heuristic.q[0],
+            self.hyper_heuristic.q[1],
+            self.hyper_heuristic.q[2],
+            self.hyper_heuristic.q[3],
+            self.hyper_heuristic.heuristic_points[0],
+            self.hyper_heuristic.heuristic_points[1],
+            self.hyper_heuristic.heuristic_points[2],
+            self.hyper_heuristic.heuristic_points[3],
+            list(self.hyper_heuristic.exp_list),
+            self.hyper_heuristic.theta,
+            self.hyper_heuristic.added_columns[0],
+            self.hyper_heuristic.added_columns[1],
+            self.hyper_heuristic.added_columns[2],
+            self.hyper_heuristic.added_columns[3],
+            best_paths_freq["BestPaths"],
+            best_paths_freq["BestEdges1"],
+            best_paths_freq["BestEdges2"],
+            best_paths_freq["Exact"],
+            self._no_improvement,
+            len(best_paths),
+        ])
+        # Rows are written in batches
+        if len(self._info_rows_buffer) >= 100 or not self._more_routes:
+            self._flush_info_rows(output_folder)
+
+    def _flush_info_rows(self, output_folder="benchmarks/results/instances"):
+        """Writes the buffered rows to the run info file."""
+        if not self._info_rows_buffer:
+            return
+        if not self._info_csv_writer:
+            self._open_info_csv(output_folder)
+        self._info_csv_writer.writerows(self._info_rows_buffer)
+        self._info_rows_buffer.clear()
+
+    def _open_info_csv(self, output_folder):
+        """Opens the run info file, it is kept open until the end of solve."""
         output_folder = Path(output_folder)
         output_file_path = output_folder / (self.G.name + '_info_run.csv')
         mode = 'a' if output_file_path.is_file() else 'w'
-        with open(output_file_path, mode, newline='') as csv_file:
-            writer = DictWriter(
-                csv_file,
-                fieldnames=[
-                    "Iteration", "Objective", "Hyper choice BP",
-                    "Hyper choice BE1", "Hyper choice BE2",
-                    "Hyper choice Exact", "Average runtime", "Quality BP",
-                    "Quality BE1", "Quality BE2", "Quality Exact",
-                    "Selection score BP", "Selection score BE1",
-                    "Selection score BE2", "Selection score Exact",
-                    "Exploration", "Theta", "Accepted columns BP",
-                    "Accepted columns BE1", "Accepted columns BE2",
-                    "Accepted columns Exact", "Active path BP",
-                    "Active path BE1", "Active path BE2", "Active path Exact",
-                    "No improvement", "Total active paths"
-                ])
-            if mode == 'w':
-                writer.writeheader()
-            writer.writerow({
-                "Iteration":
-                self._iteration,
-                "Objective":
-                relaxed_cost,
-                "Hyper choice BP":
-                self.hyper_heuristic.n[0],
-                "Hyper choice BE1":
-                self.hyper_heuristic.n[1],
-                "Hyper choice BE2":
-                self.hyper_heuristic.n[2],
-                "Hyper choice Exact":
-                self.hyper_heuristic.n[3],
-                "Average runtime":
-                self.hyper_heuristic.average_runtime,
-                "Quality BP":
-                self.hyper_heuristic.q[0],
-                "Quality BE1":
-                self.hyper_heuristic.q[1],
-                "Quality BE2":
-                self.hyper_heuristic.q[2],
-                "Quality Exact":
-                self.hyper_heuristic.q[3],
-                "Selection score BP":
-                self.hyper_heuristic.heuristic_points[0],
-                "Selection score BE1":
-                self.hyper_heuristic.heuristic_points[1],
-                "Selection score BE2":
-                self.hyper_heuristic.heuristic_points[2],
-                "Selection score Exact":
-                self.hyper_heuristic.heuristic_points[3],
-                "Exploration":
-                self.hyper_heuristic.exp_list,
-                "Theta":
-                self.hyper_heuristic.theta,
-                "Accepted columns BP":
-                self.hyper_heuristic.added_columns[0],
-                "Accepted columns BE1":
-                self.hyper_heuristic.added_columns[1],
-                "Accepted columns BE2":
-                self.hyper_heuristic.added_columns[2],
-                "Accepted columns Exact":
-                self.hyper_heuristic.added_columns[3],
-                "Active path BP":
-                best_paths_freq["BestPaths"],
-                "Active path BE1":
-                best_paths_freq["BestEdges1"],
-                "Active path BE2":
-                best_paths_freq["BestEdges2"],
-                "Active path Exact":
-                best_paths_freq["Exact"],
-                "No improvement":
-                self._no_improvement,
-                "Total active paths":
-                len(best_paths)
-            })
-        csv_file.close()
+        self._info_csv_file = open(output_file_path,
+                                   mode,
+                                   newline='',
+                                   buffering=64 * 1024)
+        self._info_csv_writer = writer(self._info_csv_file)
+        if mode == 'w':
+            self._info_csv_writer.writerow([
+                "Iteration", "Objective", "Hyper choice BP", "Hyper choice BE1",
+                "Hyper choice BE2", "Hyper choice Exact", "Average runtime",
+                "Quality BP", "Quality BE1", "Quality BE2", "Quality Exact",
+                "Selection score BP", "Selection score BE1",
+                "Selection score BE2", "Selection score Exact", "Exploration",
+                "Theta", "Accepted columns BP", "Accepted columns BE1",
+                "Accepted columns BE2", "Accepted columns Exact",
+                "Active path BP", "Active path BE1", "Active path BE2",
+                "Active path Exact", "No improvement", "Total active paths"
+            ])
+
+    def _close_info_csv(self):
+        """Writes the remaining rows and closes the run info file."""
+        self._flush_info_rows()
+        if self._info_csv_file:
+            self._info_csv_file.close()
+            self._info_csv_file = None
+            self._info_csv_writer = None
 
     def _find_columns(self):
         "Solves masterproblem and pricing problem."
+        mp = self.masterproblem
+        hh = self.hyper_heuristic
 
         # Solve restricted relaxed master problem
         if self._dive:
-            duals, relaxed_cost = self.masterproblem.solve_and_dive(
+            duals, relaxed_cost = mp.solve_and_dive(
                 time_limit=self._get_time_remaining())
         else:
-            duals, relaxed_cost = self.masterproblem.solve(
+            duals, relaxed_cost = mp.solve(
                 relax=True, time_limit=self._get_time_remaining())
 
         #get the active paths and the frequency list per heuristic
-        best_paths, best_paths_freq = self.masterproblem.get_heuristic_distribution(
-        )
+        #(only the hyper-heuristic makes use of them)
+        if self._pricing_strategy == "Hyper":
+            best_paths, best_paths_freq = mp.get_heuristic_distribution()
 
         #print performance to file
-        if self._pricing_strategy == "Hyper":
-            logger.info(
-                "iteration %s, %.6s, \tHyper Choice %s, Exact calls %s \t Average runtime %.5s, \tQuality:  [%.5s, %.5s, %.5s], \tExp_terms %0.4s\t \\theta %.5s \t Accepted Columns %s, best_paths_freq %s, \t no_improvement %s, \t length self.routes %s, \t HeurPoints [%.5s, %.5s, %.5s]"
-                % (self._iteration, relaxed_cost, self.hyper_heuristic.n,
-                   self.hyper_heuristic.n_exact,
-                   self.hyper_heuristic.average_runtime,
-                   self.hyper_heuristic.q[0], self.hyper_heuristic.q[1],
-                   self.hyper_heuristic.q[2], self.hyper_heuristic.exp_list,
-                   self.hyper_heuristic.theta,
-                   self.hyper_heuristic.added_columns, best_paths_freq,
-                   self._no_improvement, len(best_paths),
-                   self.hyper_heuristic.heuristic_points[0],
-                   self.hyper_heuristic.heuristic_points[1],
-                   self.hyper_heuristic.heuristic_points[2]))
-        else:
-            logger.info("iteration %s, %.6s" % (self._iteration, relaxed_cost))
+        if logger.isEnabledFor(logging.INFO):
+            if self._pricing_strategy == "Hyper":
+                logger.info(
+                    "iteration %s, %.6s, \tHyper Choice %s, Exact calls %s \t Average runtime %.5s, \tQuality:  [%.5s, %.5s, %.5s], \tExp_terms %0.4s\t \\theta %.5s \t Accepted Columns %s, best_paths_freq %s, \t no_improvement %s, \t length self.routes %s, \t HeurPoints [%.5s, %.5s, %.5s]",
+                    self._iteration, relaxed_cost, hh.n, hh.n_exact,
+                    hh.average_runtime, hh.q[0], hh.q[1], hh.q[2],
+                    hh.exp_list, hh.theta, hh.added_columns, best_paths_freq,
+                    self._no_improvement, len(best_paths),
+                    hh.heuristic_points[0], hh.heuristic_points[1],
+                    hh.heuristic_points[2])
+            else:
+                logger.info("iteration %s, %.6s", self._iteration,
+                            relaxed_cost)
 
         update = True
 
+        # Use exact pricing every do_exact iterations without improvement,
+        # or if column generation tails off
+        escalate = ((self._no_improvement and
+                     self._no_improvement % self.do_exact == 0) or
+                    self._is_tailing_off())
+
         #pick the heuristic
-        if self._pricing_strategy == "Hyper" and not self._no_improvement == self.do_exact:
-            if self.hyper_heuristic.initialisation:
-                if self.hyper_heuristic.performance_measure == "Relative improvement":
+        if self._pricing_strategy == "Hyper" and not escalate:
+            if hh.initialisation:
+                if (hh.performance_measure == "Relative improvement" and
+                        not self._do_exact_given):
                     self.do_exact = 30
                 #initialise the high-level algorithm
-                self.hyper_heuristic.set_current_objective(relaxed_cost)
-                self.hyper_heuristic.set_initial_time()
+                hh.set_current_objective(relaxed_cost)
+                hh.set_initial_time()
                 dynamic_pricing_strategy = "BestPaths"
                 update = True
-                self.hyper_heuristic.initialisation = False
+                hh.initialisation = False
             else:
                 #the high-level heuristic loop
-                self.hyper_heuristic.current_performance(
+                hh.current_performance(
                     new_objective_value=relaxed_cost,
                     produced_column=self.produced_column,
                     active_columns=best_paths_freq)
-                update = self.hyper_heuristic.move_acceptance()
-                self.hyper_heuristic.update_parameters()
-                dynamic_pricing_strategy = self.hyper_heuristic.pick_heurestic(
-                )
-        elif self._no_improvement == self.do_exact:
-            self._no_improvement = 0
+                update = hh.move_acceptance()
+                hh.update_parameters()
+                dynamic_pricing_strategy = hh.pick_heurestic()
+        elif escalate:
             dynamic_pricing_strategy = "Exact"
         else:
             dynamic_pricing_strategy = self._pricing_strategy
 
         # One subproblem per vehicle type
-        for vehicle in range(self._vehicle_types):
+        if self._parallel_subproblems and self._vehicle_types > 1:
+            self._find_columns_in_parallel(duals, dynamic_pricing_strategy)
+        else:
+            self._find_columns_in_series(duals, dynamic_pricing_strategy)
 
+        # Keep track of convergence rate and update stopping criteria parameters
+        self._iteration += 1
+        if self._iteration > 1 and relaxed_cost == self._lower_bound[-1]:
+            self._no_improvement += 1
+        else:
+            self._no_improvement = 0
+        if not self._dive:
+            self._lower_bound.append(relaxed_cost)
+
+        # store hyper heuristic data to csv_file
+        store_run_info = True
+        if store_run_info == True and hh.performance_measure == "Weighted average" and self._pricing_strategy == "Hyper":
+            self.store_info_heuristic(best_paths=best_paths,
+                                      best_paths_freq=best_paths_freq,
+                                      relaxed_cost=relaxed_cost)
+
+    def _find_columns_in_series(self, duals, dynamic_pricing_strategy):
+        """Solves the subproblems of all vehicle types one after the other."""
+        for vehicle in range(self._vehicle_types):
             # Solve pricing problem with randomised greedy algorithm
-            if (self._greedy and not self.time_windows
-                    and not self.distribution_collection
-                    and not self.pickup_delivery):
-                subproblem = self._def_subproblem(duals, vehicle, greedy=True)
-                self.routes, self._more_routes = subproblem.solve(n_runs=20)
-                # Update master problem only with new routes
-                if self._more_routes:
-                    for r in (r for r in self.routes
-                              if r.graph["name"] not in self.masterproblem.y
-                              ):  #kan denne linjen brukes til noe?
-                        self.masterproblem.update(r)  #This thing
+            self._solve_greedy_subproblem(duals, vehicle)
 
             # Continue searching for columns
             self._more_routes = False
@@ -664,8 +773,8 @@ class VehicleRoutingProblem:
             #len(set(self.routes)) == len(self.routes))
             if self._more_routes:
                 if self.produced_column:
-                    logger.info("# new routes %s" %
-                                (len(self.routes) - old_len))
+                    logger.info("# new routes %s",
+                                len(self.routes) - old_len)
                     (self.routes[-1]
                      ).graph["heuristic"] = dynamic_pricing_strategy
                     self.masterproblem.update(self.routes[-1])
@@ -673,23 +782,95 @@ class VehicleRoutingProblem:
                     logger.info("Column not produced")
             else:
                 logger.info("No more routes")
-                self.hyper_heuristic.timeend = time()
-
-        # Keep track of convergence rate and update stopping criteria parameters
-        self._iteration += 1
-        if self._iteration > 1 and relaxed_cost == self._lower_bound[-1]:
-            self._no_improvement += 1
-        else:
-            self._no_improvement = 0
-        if not self._dive:
-            self._lower_bound.append(relaxed_cost)
+                self.hyper_heuristic.timeend = perf_counter()
+
+    def _solve_greedy_subproblem(self, duals, vehicle):
+        """Solves pricing problem with randomised greedy algorithm if possible."""
+        if (self._greedy and not self.time_windows
+                and not self.distribution_collection
+                and not self.pickup_delivery):
+            subproblem = self._def_subproblem(duals, vehicle, greedy=True)
+            self.routes, self._more_routes = subproblem.solve(n_runs=20)
+            # Update master problem only with new routes
+            if self._more_routes:
+                for r in self.routes[self._routes_processed_len:]:
+                    if r.graph["name"] not in self.masterproblem.y:
+                        self.masterproblem.update(r)
+            self._routes_processed_len = len(self.routes)
 
-        # store hyper heuristic data to csv_file
-        store_run_info = True
-        if store_run_info == True and self.hyper_heuristic.performance_measure == "Weighted average" and self._pricing_strategy == "Hyper":
-            self.store_info_heuristic(best_paths=best_paths,
-                                      best_paths_freq=best_paths_freq,
-                                      relaxed_cost=relaxed_cost)
+    def _find_columns_in_parallel(self, duals, pricing_strategy):
+        """
+        Solves the subproblems of all vehicle types in parallel processes.
+        Each process works on a copy of the problem and returns its new
+        routes. As in series, the last one is added to the master problem.
+        """
+        executor = self._get_executor()
+        futures = []
+        for vehicle in range(self._vehicle_types):
+            # Solve pricing problem with randomised greedy algorithm
+            self._solve_greedy_subproblem(duals, vehicle)
+            futures.append(
+                executor.submit(_solve_subproblem_in_worker,
+                                      self._copy_for_subproblem(),
+                                      pricing_strategy, vehicle, duals))
+
+        self._more_routes = False
+        self.produced_column = False
+        for future in futures:
+            new_routes, more_routes, produced_column, n_exact = future.result()
+            self._more_routes = self._more_routes or more_routes
+            self.produced_column = self.produced_column or produced_column
+            self.hyper_heuristic.n_exact += n_exact
+            self._add_worker_routes(new_routes)
+            if not more_routes:
+                logger.info("No more routes")
+                self.hyper_heuristic.timeend = perf_counter()
+            elif not produced_column:
+                logger.info("Column not produced")
+            else:
+                logger.info("# new routes %s", len(new_routes))
+                # As in series, the last new route enters the master problem
+                new_routes[-1].graph["heuristic"] = pricing_strategy
+                self.masterproblem.update(new_routes[-1])
+        self.routes = self._routes
+
+    def _add_worker_routes(self, new_routes):
+        """Adds routes found on a copy of the problem to the pool of routes."""
+        for route in new_routes:
+            # Route ids are given by the order in which routes are added
+            route.graph["name"] = len(self._routes) + 1
+            self._routes.append(route)
+            for v in route.nodes():
+                if v not in ["Source", "Sink"]:
+                    self._routes_with_node[v].append(route)
+
+    def _get_executor(self):
+        """Returns the process pool used for the subproblems."""
+        if not self._executor:
+            n_workers = max(self._vehicle_types,
+                            max(map(len, self._pricing_parameters.values())))
+            self._n_workers = min(n_workers, cpu_count())
+            self._executor = ProcessPoolExecutor(max_workers=self._n_workers)
+        return self._executor
+
+    def _copy_for_subproblem(self):
+        """
+        Returns a copy of the problem with only the attributes needed to
+        solve a subproblem in another process, as it is sent at each iteration.
+        Routes found on the copy are stored in an empty list.
+        """
+        vrp = VehicleRoutingProblem.__new__(VehicleRoutingProblem)
+        for attribute in self._subproblem_attributes:
+            setattr(vrp, attribute, getattr(self, attribute))
+        if self._time_limit:
+            vrp._deadline = self._deadline
+        vrp.hyper_heuristic = HyperHeuristic()
+        vrp._parallel_subproblems = False
+        vrp._subproblem_cache = {}
+        vrp._routes = []
+        vrp.routes = vrp._routes
+        vrp._routes_with_node = defaultdict(list)
+        return vrp
 
     def _get_time_remaining(self, mip: bool = False):
         """
@@ -702,7 +883,7 @@ class VehicleRoutingProblem:
             - 0 if time remaining < 0
         """
         if self._time_limit:
-            remaining_time = self._time_limit - (time() - self._start_time)
+            remaining_time = self._deadline - perf_counter()
             if mip:
                 return max(5, remaining_time)
             if remaining_time > 0:
@@ -718,8 +899,28 @@ class VehicleRoutingProblem:
         pricing_parameter=None,
         greedy=False,
     ):
-        """Instanciates the subproblem."""
+        """
+        Instanciates the subproblem.
+        Subproblems on the unpruned graph (pricing strategy "Exact") solved
+        with cspy or the greedy algorithm are reused across iterations,
+        only their duals are updated.
+        """
+        cacheable = pricing_strategy == "Exact" and (greedy or self._cspy)
+        if cacheable and (vehicle_type, greedy) in self._subproblem_cache:
+            subproblem = self._subproblem_cache[vehicle_type, greedy]
+            subproblem.update_duals(duals)
+            return subproblem
 
+        subproblem = self._new_subproblem(duals, vehicle_type,
+                                          pricing_strategy, pricing_parameter,
+                                          greedy)
+        if cacheable:
+            self._subproblem_cache[vehicle_type, greedy] = subproblem
+        return subproblem
+
+    def _new_subproblem(self, duals, vehicle_type, pricing_strategy,
+                        pricing_parameter, greedy):
+        """Creates a new subproblem."""
         if greedy:
             subproblem = SubProblemGreedy(
                 self.G,
@@ -737,7 +938,8 @@ class VehicleRoutingProblem:
             return subproblem
 
         if self._cspy:
-            # With cspy
+            # With cspy, only imported when needed
+            from vrpy.subproblem_cspy import SubProblemCSPY
             subproblem = SubProblemCSPY(
                 self.G,
                 duals,
@@ -787,23 +989,11 @@ class VehicleRoutingProblem:
                 and not self.periodic):
             best_value = 1e10
             best_num_vehicles = 1e10
-            for alpha in [x / 10 for x in range(1, 20)]:
-                # for beta in  [x / 10 for x in range(20)]:
-                # for gamma in  [x / 10 for x in range(20)]:
-                alg = ClarkeWright(
-                    self.G,
-                    self.load_capacity,
-                    self.duration,
-                    self.num_stops,
-                    alpha,
-                    # beta,
-                    # gamma,
-                )
-                alg.run()
-                self._initial_routes += alg.best_routes
-                if alg.best_value < best_value:
-                    best_value = alg.best_value
-                    best_num_vehicles = len(alg.best_routes)
+            for (value, routes) in self._run_clarke_wright():
+                self._initial_routes += routes
+                if value < best_value:
+                    best_value = value
+                    best_num_vehicles = len(routes)
             logger.info(
                 "Clarke & Wright solution found with value %s and %s vehicles"
                 % (best_value, best_num_vehicles))
@@ -828,6 +1018,33 @@ class VehicleRoutingProblem:
             alg.run()
             self._initial_routes = alg.round_trips
 
+    def _run_clarke_wright(self):
+        """
+        Runs Clarke & Wright for each value of alpha,
+        in parallel processes if parallel_subproblems.
+
+        Returns:
+            list: (value, routes) of each run, ordered by alpha.
+        """
+        # The savings only differ by alpha from one run to the next
+        precomputed = ClarkeWright.precompute(self.G)
+        alphas = [x / 10 for x in range(1, 20)]
+        # for beta in  [x / 10 for x in range(20)]:
+        # for gamma in  [x / 10 for x in range(20)]:
+        run = partial(
+            _run_clarke_wright_in_worker,
+            precomputed=precomputed,
+            load_capacity=self.load_capacity,
+            duration=self.duration,
+            num_stops=self.num_stops,
+        )
+        if not self._parallel_subproblems:
+            return [run(alpha) for alpha in alphas]
+        executor = self._get_executor()
+        # Each chunk of runs pickles the precomputed data once
+        chunksize = -(-len(alphas) // self._n_workers)
+        return list(executor.map(run, alphas, chunksize=chunksize))
+
     def _convert_initial_routes_to_digraphs(self):
         """
         Converts list of initial routes to list of Digraphs.
@@ -835,24 +1052,23 @@ class VehicleRoutingProblem:
         """
         route_id = 0
         self._routes = []
-        self._routes_with_node = {}
+        self._routes_with_node = defaultdict(list)
+        succ = self.G.succ
         for r in self._initial_routes:
-            total_cost = 0
             route_id += 1
-            G = DiGraph(name=route_id)
             edges = list(zip(r[:-1], r[1:]))
-            for (i, j) in edges:
-                edge_cost = self.G.edges[i, j]["cost"][0]
-                G.add_edge(i, j, cost=edge_cost)
-                total_cost += edge_cost
-            G.graph["cost"] = total_cost
+            costs = [succ[i][j]["cost"][0] for (i, j) in edges]
+            G = DiGraph(
+                [(i, j, {
+                    "cost": edge_cost
+                }) for ((i, j), edge_cost) in zip(edges, costs)],
+                name=route_id,
+            )
+            G.graph["cost"] = sum(costs)
             G.graph["vehicle_type"] = 0
             self._routes.append(G)
             for v in r[1:-1]:
-                if v in self._routes_with_node:
-                    self._routes_with_node[v].append(G)
-                else:
-                    self._routes_with_node[v] = [G]
+                self._routes_with_node[v].append(G)
 
     def knapsack(self, weights, capacity):
         """
@@ -863,22 +1079,8 @@ class VehicleRoutingProblem:
             Returns:
                 (int) : maximum number of objects
             """
-        n = len(weights)
-        # sol : [items, remaining capacity]
-        sol = [[0] * (capacity + 1) for i in range(n)]
-        added = [[False] * (capacity + 1) for i in range(n)]
-        for i in range(n):
-            for j in range(capacity + 1):
-                if weights[i] > j:
-                    sol[i][j] = sol[i - 1][j]
-                else:
-                    sol_add = 1 + sol[i - 1][j - weights[i]]
-                    if sol_add > sol[i - 1][j]:
-                        sol[i][j] = sol_add
-                        added[i][j] = True
-                    else:
-                        sol[i][j] = sol[i - 1][j]
-        return sol[n - 1][capacity]
+        # With identical profits, the lightest objects are picked first
+        return bisect_right(list(accumulate(sorted(weights))), capacity)
 
     def _get_num_stops_upper_bound(self, max_capacity):
         """
@@ -889,10 +1091,6 @@ class VehicleRoutingProblem:
         visits, subject to capacity constraints.
         """
 
-        #REFACTOR
-        #plassér knapsackfunksjonen utenfor og kall
-        #kan gjøre knapsack enklere
-
         # Maximize sum of vertices such that sum of demands respect capacity constraints
         demands = [int(self.G.nodes[v]["demand"]) for v in self.G.nodes()]
         # Solve the knapsack problem
@@ -915,6 +1113,7 @@ class VehicleRoutingProblem:
         If not, for all edges of the incomplete route, the cost is set to 0
         (to guarantee that the sequence will remain as is).
         """
+        zero_cost = [0] * self._vehicle_types
         for route in self._preassignments:
             edges = list(zip(route[:-1], route[1:]))
             # If the route cannot be extended, remove it
@@ -924,57 +1123,75 @@ class VehicleRoutingProblem:
             # Otherwise, keep it and set the costs to 0
             else:
                 for (i, j) in edges:
-                    for k in range(self._vehicle_types):
-                        self.G.edges[i, j]["cost"][k] = 0
+                    self.G.edges[i, j]["cost"] = zero_cost.copy()
 
         # If all vertices are locked, do not generate columns
         if len(self.G.nodes()) == 2:
             self._more_routes = False
 
     def _add_fixed_costs(self):
-        """Adds fixed cost on each outgoing edge from Source."""
-        for v in self.G.successors("Source"):
-            for k in range(self._vehicle_types):
-                self.G.edges["Source", v]["cost"][k] += self.fixed_cost[k]
+        """
+        Adds fixed cost on each outgoing edge from Source.
+        Costs that already include it (previous solve) are left as is.
+        """
+        for v, data in self.G.succ["Source"].items():
+            if data["cost"] is self._fixed_costs_added.get(v):
+                continue
+            data["cost"] = [
+                c + f for (c, f) in zip(data["cost"], self.fixed_cost)
+            ]
+            self._fixed_costs_added[v] = data["cost"]
 
     def _remove_infeasible_arcs_capacities(self):
-        infeasible_arcs = []
-        for (i, j) in self.G.edges():
-            if (self.G.nodes[i]["demand"] + self.G.nodes[j]["demand"] >
-                    self._max_capacity):
-                infeasible_arcs.append((i, j))
+        """
+        Removes the arcs whose end nodes have a total demand larger
+        than the maximum capacity, with a vectorized test on all node pairs.
+        """
+        if len(self.G) <= 2:
+            return
+        nodes = list(self.G.nodes())
+        demand = array([self.G.nodes[v]["demand"] for v in nodes])
+        over_capacity = argwhere(
+            demand[:, None] + demand[None, :] > self._max_capacity)
+        succ = self.G.succ
+        infeasible_arcs = [(nodes[i], nodes[j])
+                           for (i, j) in over_capacity
+                           if nodes[j] in succ[nodes[i]]]
         self.G.remove_edges_from(infeasible_arcs)
 
     def _remove_infeasible_arcs_time_windows(self):
+        """
+        Removes the arcs that violate time windows,
+        with a single pass over a snapshot of the edges.
+        """
+        if len(self.G) <= 2:
+            return
+        nodes = self.G.nodes
         infeasible_arcs = []
-        for (i, j) in self.G.edges():
-            travel_time = self.G.edges[i, j]["time"]
-            service_time = self.G.nodes[i]["service_time"]
-            tail_inf_time_window = self.G.nodes[i]["lower"]
-            head_sup_time_window = self.G.nodes[j]["upper"]
-            if (tail_inf_time_window + travel_time + service_time >
-                    head_sup_time_window):
+        for (i, j, data) in list(self.G.edges(data=True)):
+            tail = nodes[i]
+            if (tail["lower"] + data["time"] + tail["service_time"] >
+                    nodes[j]["upper"]):
                 infeasible_arcs.append((i, j))
-            # Strengthen time windows
-            for v in self.G.nodes():
-                if v not in ["Source", "Sink"]:
-                    # earliest time is coming straight from depot
-                    self.G.nodes[v]["lower"] = max(
-                        self.G.nodes[v]["lower"],
-                        self.G.nodes["Source"]["lower"] +
-                        self.G.edges["Source", v]["time"],
-                    )
-                    # Latest time is going straight to depot
-                    self.G.nodes[v]["upper"] = min(
-                        self.G.nodes[v]["upper"],
-                        self.G.nodes["Sink"]["upper"] -
-                        self.G.edges[v, "Sink"]["time"],
-                    )
         self.G.remove_edges_from(infeasible_arcs)
 
-    def _prune_graph(
-        self
-    ):  #feed in initial graph -> prunegraph removes the infeasible stuff, if it comes out the same then it is good. runs greedy
+    def _strengthen_time_windows(self):
+        """Strengthens time windows with the direct trips from/to the depot."""
+        source, sink = self.G.nodes["Source"], self.G.nodes["Sink"]
+        for v, data in self.G.nodes(data=True):
+            if v not in ["Source", "Sink"]:
+                # earliest time is coming straight from depot
+                data["lower"] = max(
+                    data["lower"],
+                    source["lower"] + self.G.edges["Source", v]["time"],
+                )
+                # Latest time is going straight to depot
+                data["upper"] = min(
+                    data["upper"],
+                    sink["upper"] - self.G.edges[v, "Sink"]["time"],
+                )
+
+    def _prune_graph(self):
         """
         Preprocessing:
            - Removes useless edges from graph
@@ -984,17 +1201,34 @@ class VehicleRoutingProblem:
             self._max_capacity = max(self.load_capacity)
         else:
             self._max_capacity = self.load_capacity
+        # Pruning only depends on the graph and the problem parameters
+        if self._pruned:
+            return
+        # Strengthen time windows first, as tighter windows make more arcs
+        # infeasible
+        if self.time_windows:
+            self._strengthen_time_windows()
         # Remove infeasible arcs (capacities)
         if self.load_capacity:
             self._remove_infeasible_arcs_capacities()
-
         # Remove infeasible arcs (time windows)
         if self.time_windows:
             self._remove_infeasible_arcs_time_windows()
+        self._pruned = True
+
+    def invalidate_prune(self):
+        """
+        Forces the preprocessing of the graph on the next call to solve.
+        To be called if G is modified between two solves.
+        """
+        self._attrs_initialized = False
+        self._pruned = False
 
     def _set_zero_attributes(self):
         """ Sets attr = 0 if missing """
-
+        # Attributes are only ever added, so later solves can skip this pass
+        if self._attrs_initialized:
+            return
         for v in self.G.nodes():
             for attribute in [
                     "demand",
@@ -1015,6 +1249,7 @@ class VehicleRoutingProblem:
             for attribute in ["frequency"]:
                 if attribute not in self.G.nodes[v]:
                     self.G.nodes[v][attribute] = 1
+        self._attrs_initialized = True
 
     def _set_time_to_zero_if_missing(self):
         """ Sets time = 0 if missing """
@@ -1027,10 +1262,10 @@ class VehicleRoutingProblem:
         """ Readjusts Sink time windows """
 
         if self.G.nodes["Sink"]["upper"] == 0:
+            nodes = self.G.nodes
             self.G.nodes["Sink"]["upper"] = max(
-                self.G.nodes[u]["upper"] + self.G.nodes[u]["service_time"] +
-                self.G.edges[u, "Sink"]["time"]
-                for u in self.G.predecessors("Sink"))
+                nodes[u]["upper"] + nodes[u]["service_time"] + data["time"]
+                for (u, data) in self.G.pred["Sink"].items())
 
     def _update_dummy_attributes(self):
         """Adds dummy attributes on nodes and edges if missing."""
@@ -1048,17 +1283,39 @@ class VehicleRoutingProblem:
         # Readjust Sink time windows
         self._readjust_sink_time_windows()
 
-        # Keep a (deep) copy of the graph
-        self._H = self.G.to_directed()
+        # Snapshot the attributes read to describe the solution
+        self._build_attribute_caches()
+
+    def _build_attribute_caches(self):
+        """
+        Caches the attributes of G read to describe the solution,
+        before they are altered by the locking and pruning of the graph.
+        """
+        self._demand = {}
+        self._collect = {}
+        self._service_time = {}
+        self._lower = {}
+        for v, data in self.G.nodes(data=True):
+            self._demand[v] = data["demand"]
+            self._collect[v] = data["collect"]
+            self._service_time[v] = data["service_time"]
+            self._lower[v] = data["lower"]
+        self._edge_cost = {}
+        self._travel_time = {}
+        for (i, j, data) in self.G.edges(data=True):
+            # Costs are lists that are modified in place when locking
+            self._edge_cost[i, j] = list(data["cost"])
+            self._travel_time[i, j] = data["time"]
 
     def _best_routes_as_node_lists(self):
         """Converts route as DiGraph to route as node list."""
+        # The solution properties are computed again for the new routes
+        self._solution_cache = {}
         self._best_routes = {}
         self._best_routes_vehicle_type = {}
         route_id = 1
         for route in self._best_routes_as_graphs:
-            node_list = shortest_path(route, "Source", "Sink")
-            self._best_routes[route_id] = node_list
+            self._best_routes[route_id] = walk(route)
             self._best_routes_vehicle_type[route_id] = route.graph[
                 "vehicle_type"]
             route_id += 1
@@ -1070,9 +1327,8 @@ class VehicleRoutingProblem:
                 best_cost = 1e10
                 for k in range(self._vehicle_types):
                     # If different vehicles, the cheapest feasible one is accounted for
-                    cost = sum(self._H.edges[i, j]["cost"][k]
-                               for (i, j) in edges)
-                    load = sum(self._H.nodes[i]["demand"] for i in route)
+                    cost = sum(self._edge_cost[i, j][k] for (i, j) in edges)
+                    load = sum(self._demand[i] for i in route)
                     if cost < best_cost:
                         if self.load_capacity:
                             if load <= self.load_capacity[k]:
@@ -1085,15 +1341,19 @@ class VehicleRoutingProblem:
 
     def _format(self):
         """Attributes are stored as singletons."""
-        for (i, j) in self.G.edges():
-            if not isinstance(self.G.edges[i, j]["cost"], list):
-                self.G.edges[i, j]["cost"] = [self.G.edges[i, j]["cost"]]
-        if self.num_vehicles and not isinstance(self.num_vehicles, list):
-            self.num_vehicles = [self.num_vehicles]
-        if self.fixed_cost and not isinstance(self.fixed_cost, list):
-            self.fixed_cost = [self.fixed_cost]
-        if self.load_capacity and not isinstance(self.load_capacity, list):
-            self.load_capacity = [self.load_capacity]
+        for (i, j, data) in self.G.edges(data=True):
+            if not isinstance(data["cost"], list):
+                data["cost"] = [data["cost"]]
+        self.num_vehicles = self._as_list(self.num_vehicles)
+        self.fixed_cost = self._as_list(self.fixed_cost)
+        self.load_capacity = self._as_list(self.load_capacity)
+
+    @staticmethod
+    def _as_list(value):
+        """Returns a single (non zero) value as a singleton."""
+        if value and not isinstance(value, list):
+            return [value]
+        return value
 
     def _define_vehicle_types(self):
         """
@@ -1119,6 +1379,13 @@ class VehicleRoutingProblem:
             return sum(self.best_routes_cost.values()) + penalty
         return sum(self.best_routes_cost.values())
 
+    @property
+    def lower_bound(self):
+        """Returns value of the last relaxed master problem (None if not solved)."""
+        if self._lower_bound:
+            return self._lower_bound[-1]
+        return None
+
     @property
     def best_routes(self):
         """
@@ -1126,31 +1393,76 @@ class VehicleRoutingProblem:
         Keys : route_id; values : list of ordered nodes from Source to Sink."""
         return self._best_routes
 
-    @property
+    @_solution_property
     def best_routes_cost(self):
         """Returns dict with route ids as keys and route costs as values."""
         cost = {}
-        for route in self.best_routes:
-            edges = list(
-                zip(self.best_routes[route][:-1], self.best_routes[route][1:]))
-            k = self._best_routes_vehicle_type[route]
-            cost[route] = sum(self._H.edges[i, j]["cost"][k]
-                              for (i, j) in edges)
+        edge_cost = self._edge_cost
+        for i, route in self.best_routes.items():
+            k = self._best_routes_vehicle_type[i]
+            cost[i] = sum(edge_cost[e][k] for e in zip(route, route[1:]))
         return cost
 
-    @property
+    @_solution_property
+    def _route_metrics(self):
+        """
+        Returns dict with route ids as keys and as values a dict with
+        the load, node loads, duration, arrival and departure times of the route,
+        computed with a single traversal per route.
+        """
+        demand = self._demand
+        collect = self._collect
+        service_time = self._service_time
+        lower = self._lower
+        travel_time = self._travel_time
+        metrics = {}
+        for i, route in self.best_routes.items():
+            load = amount = 0
+            node_load = {}
+            total_travel_time = total_service_time = 0
+            # The running times are carried from one node to the next
+            arr = dep = lower["Source"]
+            arrival = {}
+            departure = {"Source": dep}
+            last = len(route) - 1
+            tail = None
+            for j, head in enumerate(route):
+                load += demand[head]
+                amount += demand[head]
+                if self.distribution_collection:
+                    amount -= collect[head]
+                node_load[head] = amount
+                total_service_time += service_time[head]
+                if j > 0:
+                    travel = travel_time[tail, head]
+                    total_travel_time += travel
+                    arr = max(arr + service_time[tail] + travel, lower[head])
+                    arrival[head] = arr
+                    if j < last:
+                        dep = (max(dep + service_time[tail] + travel,
+                                   lower[head]) + service_time[head])
+                        departure[head] = dep
+                tail = head
+            del node_load["Source"]
+            duration = total_travel_time + total_service_time
+            metrics[i] = {
+                "load": load,
+                "node_load": node_load,
+                "duration": duration,
+                "arrival": arrival,
+                "departure": departure,
+            }
+        return metrics
+
+    @_solution_property
     def best_routes_load(self):
         """Returns dict with route ids as keys and route loads as values."""
-        load = {}
         if (not self.load_capacity or self.distribution_collection
                 or self.pickup_delivery):
-            return load
-        for route in self.best_routes:
-            load[route] = sum(self._H.nodes[v]["demand"]
-                              for v in self.best_routes[route])
-        return load
+            return {}
+        return {i: m["load"] for i, m in self._route_metrics.items()}
 
-    @property
+    @_solution_property
     def node_load(self):
         """
         Returns nested dict.
@@ -1158,85 +1470,37 @@ class VehicleRoutingProblem:
         If truck is collecting, load refers to accumulated load on truck.
         If truck is distributing, load refers to accumulated amount that has been unloaded.
         """
-        load = {}
         if (not self.load_capacity and not self.pickup_delivery
                 and not self.distribution_collection):
-            return load
-        for i in self.best_routes:
-            load[i] = {}
-            amount = 0
-            for v in self.best_routes[i]:
-                amount += self._H.nodes[v]["demand"]
-                if self.distribution_collection:
-                    amount -= self._H.nodes[v]["collect"]
-                load[i][v] = amount
-            del load[i]["Source"]
-        return load
+            return {}
+        return {i: m["node_load"] for i, m in self._route_metrics.items()}
 
-    @property
+    @_solution_property
     def best_routes_duration(self):
         """Returns dict with route ids as keys and route durations as values."""
-        duration = {}
         if not self.duration and not self.time_windows:
-            return duration
-        for route in self.best_routes:
-            edges = list(
-                zip(self.best_routes[route][:-1], self.best_routes[route][1:]))
-            # Travel times
-            duration[route] = sum(self._H.edges[i, j]["time"]
-                                  for (i, j) in edges)
-            # Service times
-            duration[route] += sum(self._H.nodes[v]["service_time"]
-                                   for v in self.best_routes[route])
-
-        return duration
+            return {}
+        return {i: m["duration"] for i, m in self._route_metrics.items()}
 
-    @property
+    @_solution_property
     def arrival_time(self):
         """
         Returns nested dict.
         First key : route id ; second key : node ; value : arrival time.
         """
-        arrival = {}
         if not self.duration and not self.time_windows:
-            return arrival
-        for i in self.best_routes:
-            arrival[i] = {}
-            arrival[i]["Source"] = self._H.nodes["Source"]["lower"]
-            route = self.best_routes[i]
-            for j in range(1, len(route)):
-                tail = route[j - 1]
-                head = route[j]
-                arrival[i][head] = max(
-                    arrival[i][tail] + self._H.nodes[tail]["service_time"] +
-                    self._H.edges[tail, head]["time"],
-                    self._H.nodes[head]["lower"],
-                )
-            del arrival[i]["Source"]
-        return arrival
+            return {}
+        return {i: m["arrival"] for i, m in self._route_metrics.items()}
 
-    @property
+    @_solution_property
     def departure_time(self):
         """
         Returns nested dict.
         First key : route id ; second key : node ; value : departure time.
         """
-        departure = {}
         if not self.duration and not self.time_windows:
-            return departure
-        for i in self.best_routes:
-            departure[i] = {}
-            departure[i]["Source"] = self._H.nodes["Source"]["lower"]
-            route = self.best_routes[i]
-            for j in range(1, len(route) - 1):
-                tail = route[j - 1]
-                head = route[j]
-                departure[i][head] = (max(
-                    departure[i][tail] + self._H.nodes[tail]["service_time"] +
-                    self._H.edges[tail, head]["time"],
-                    self._H.nodes[head]["lower"],
-                ) + self._H.nodes[head]["service_time"])
-        return departure
+            return {}
+        return {i: m["departure"] for i, m in self._route_metrics.items()}
 
     @property
     def schedule(self):
@@ -1244,3 +1508,53 @@ class VehicleRoutingProblem:
         if self.periodic:
             return self._schedule
         return
+
+
+def _run_clarke_wright_in_worker(alpha, precomputed, load_capacity, duration,
+                                 num_stops):
+    """
+    Runs Clarke & Wright with a given alpha on precomputed savings data.
+
+    Returns:
+        tuple: value and routes of the solution found.
+    """
+    alg = ClarkeWright(
+        precomputed["G"],
+        load_capacity,
+        duration,
+        num_stops,
+        alpha,
+        precomputed=precomputed,
+    )
+    alg.run()
+    return alg.best_value, alg.best_routes
+
+
+def _solve_pricing_parameter_in_worker(vrp, pricing_strategy,
+                                       pricing_parameter, vehicle, duals):
+    """
+    Solves the subproblem of a vehicle type with a single parameter of a
+    heuristic pricing strategy on a pickled copy of the problem.
+
+    Returns:
+        tuple: new routes, True if more routes.
+    """
+    vrp = loads(vrp)
+    subproblem = vrp._def_subproblem(duals, vehicle, pricing_strategy,
+                                     pricing_parameter)
+    return subproblem.solve(vrp._get_time_remaining())
+
+
+def _solve_subproblem_in_worker(vrp, pricing_strategy, vehicle, duals):
+    """
+    Solves the subproblem of a vehicle type on a copy of the problem
+    (see VehicleRoutingProblem._copy_for_subproblem).
+
+    Returns:
+        tuple: new routes, True if more routes, True if a column was produced,
+        number of calls to the exact algorithm.
+    """
+    produced_column = vrp._solve_subproblem_with_heuristic(
+        pricing_strategy=pricing_strategy, vehicle=vehicle, duals=duals)
+    return (vrp._routes, vrp._more_routes, produced_column,
+            vrp.hyper_heuristic.n_exact)
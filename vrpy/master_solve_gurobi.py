@@ -0,0 +1,211 @@
+import logging
+from typing import Optional
+
+import gurobipy as gp
+from gurobipy import GRB
+
+from vrpy.masterproblem import MasterProblemBase
+
+logger = logging.getLogger(__name__)
+
+# Gurobi environment shared by all master problems, started on first use
+_env = None
+
+
+def _get_env():
+    """Returns the shared Gurobi environment, with the output turned off."""
+    global _env
+    if _env is None:
+        _env = gp.Env(empty=True)
+        _env.setParam("OutputFlag", 0)
+        _env.start()
+    return _env
+
+
+class MasterSolveGurobi(MasterProblemBase):
+    """
+    Solves the master problem for the column generation procedure with a
+    Gurobi model that persists across iterations: new columns are added to
+    the model in place and relaxations are reoptimized from the last basis.
+
+    Inherits problem parameters from MasterProblemBase
+    """
+
+    _optimal_status = GRB.OPTIMAL
+
+    def __init__(self, *args):
+        super(MasterSolveGurobi, self).__init__(*args)
+        # create problem
+        self.model = gp.Model("MasterProblem", env=_get_env())
+        # Later relaxations only differ by a few columns
+        self._first_solve = True
+
+        self._formulate()
+
+    def update(self, new_route):
+        """Add new column.
+        The route selection variable is attached to the existing constraints
+        (column-wise), the basis of the last solve is kept.
+        """
+        self._add_route_selection_variable(new_route)
+
+    # Private methods to solve and output #
+
+    def _solve(self, relax: bool, time_limit: Optional[int]):
+        # Set variable types
+        if relax != self._last_relax:
+            vtype = GRB.CONTINUOUS if relax else GRB.INTEGER
+            # Pending variables are only listed after an update
+            self.model.update()
+            for var in self.model.getVars():
+                var.VType = vtype
+            self._last_relax = relax
+        if relax and self._first_solve:
+            # No basis to start from yet
+            self.model.Params.Method = 3  # 3 = concurrent
+        elif relax:
+            # Adding columns keeps the last basis primal feasible
+            self.model.Params.Method = 0  # 0 = primal simplex
+        else:
+            self.model.Params.Method = -1  # -1 = automatic
+            # Force vehicle bound artificial variable to 0
+            for var in self.dummy_bound.values():
+                var.UB = 0
+                var.LB = 0
+        # Only specify time limit if given
+        self.model.Params.TimeLimit = (time_limit if time_limit is not None
+                                       else GRB.INFINITY)
+        self._first_solve = False
+        self.model.optimize()
+        return self.model.Status
+
+    def _objective_value(self):
+        return self.model.ObjVal
+
+    def _value(self, var):
+        return var.X
+
+    def _dual(self, constr):
+        return constr.Pi
+
+    def _route_values(self):
+        """Routes of the problem with the value of their selection variable.
+        The values are queried from the model at once.
+        """
+        return list(
+            zip([r for r, y in self._route_vars],
+                self.model.getAttr("X", [y for r, y in self._route_vars])))
+
+    # Private methods for formulating and updating the problem #
+
+    def _formulate(self):
+        """
+        Set covering formulation.
+        Variables are continuous when relaxed, otherwise binary.
+        """
+        self.model.ModelSense = GRB.MINIMIZE
+
+        self._add_set_covering_constraints()
+
+        if self.num_vehicles and not self.periodic:
+            self._add_bound_vehicles()
+
+        # Add variables #
+        # Route selection variables
+        for route in self.routes:
+            self._add_route_selection_variable(route)
+        # if dropping nodes is allowed
+        if self.drop_penalty:
+            self._add_drop_variables()
+
+        # if frequencies, dummy variables are needed to find initial solution
+        if self.periodic:
+            self._add_artificial_variables()
+
+        # Add dummy_vehicle variables
+        self._add_vehicle_dummy_variables()
+
+    def _add_set_covering_constraints(self):
+        """
+        All vertices must be visited exactly once, or periodically if
+        frequencies are given.
+        If dropping nodes is allowed, the drop variable is activated
+        (as well as a penalty is the cost function).
+        """
+        for node, constr_name in self._visit_constr_names.items():
+            # Set RHS
+            right_hand_term = self.G.nodes[node][
+                "frequency"] if self.periodic else 1
+            # Save set covering constraints
+            self.set_covering_constrs[node] = self.model.addConstr(
+                gp.LinExpr() >= right_hand_term, name=constr_name)
+
+    def _add_route_selection_variable(self, route):
+        """
+        Adds the column of a route: its coefficients in the set covering
+        constraints, in the bound on its vehicle type and in the objective.
+        """
+        constrs = [
+            self.set_covering_constrs[r]
+            for r in route.nodes()
+            if r in self.set_covering_constrs
+        ]
+        vehicle_type = route.graph["vehicle_type"]
+        # Bounds on the number of vehicles are not set if periodic
+        if vehicle_type in self.vehicle_bound_constrs:
+            constrs.append(self.vehicle_bound_constrs[vehicle_type])
+        y = self.model.addVar(
+            lb=0,
+            ub=1,
+            obj=route.graph["cost"],
+            vtype=GRB.CONTINUOUS if self._last_relax else GRB.INTEGER,
+            name="y{}".format(route.graph["name"]),
+            column=gp.Column([1] * len(constrs), constrs),
+        )
+        self.y[route.graph["name"]] = y
+        self._route_vars.append((route, y))
+
+    def _add_vehicle_dummy_variables(self):
+        for key in self.vehicle_bound_constrs:
+            self.dummy_bound[key] = self.model.addVar(
+                lb=0,
+                obj=1e10,
+                vtype=GRB.CONTINUOUS,
+                name="artificial_bound_%s" % key,
+                column=gp.Column([-1], [self.vehicle_bound_constrs[key]]),
+            )
+
+    def _add_drop_variables(self):
+        """
+        Boolean variable.
+        drop[v] takes value 1 if and only if node v is dropped.
+        """
+        for node in self.G.nodes():
+            if self.G.nodes[node]["demand"] > 0 and node != "Source":
+                self.drop[node] = self.model.addVar(
+                    lb=0,
+                    ub=1,
+                    obj=self.drop_penalty,
+                    vtype=GRB.INTEGER,
+                    name="drop_%s" % node,
+                    column=gp.Column([1], [self.set_covering_constrs[node]]),
+                )
+
+    def _add_artificial_variables(self):
+        """Continuous variable used for finding initial feasible solution."""
+        for node in self.G.nodes():
+            if self.G.nodes[node]["frequency"] > 1 and node != "Source":
+                self.dummy[node] = self.model.addVar(
+                    lb=0,
+                    obj=1e10,
+                    vtype=GRB.INTEGER,
+                    name="periodic_%s" % node,
+                    column=gp.Column([1], [self.set_covering_constrs[node]]),
+                )
+
+    def _add_bound_vehicles(self):
+        """Adds empty constraints and sets the right hand side"""
+        for k, bound in enumerate(self.num_vehicles):
+            self.vehicle_bound_constrs[k] = self.model.addConstr(
+                gp.LinExpr() <= bound,
+                name="upper_bound_vehicles_%s" % k)
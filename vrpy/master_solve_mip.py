@@ -0,0 +1,192 @@
+import logging
+from collections import defaultdict
+from typing import Optional
+
+from mip import (CBC, CONTINUOUS, INF, INTEGER, MINIMIZE, Column, Model,
+                 OptimizationStatus, xsum)
+
+from vrpy.masterproblem import MasterProblemBase
+
+logger = logging.getLogger(__name__)
+
+
+class MasterSolveMip(MasterProblemBase):
+    """
+    Solves the master problem for the column generation procedure with a
+    python-mip model that persists across iterations: CBC is called
+    in-process and new columns are added to the model in place.
+
+    Inherits problem parameters from MasterProblemBase
+    """
+
+    _optimal_status = OptimizationStatus.OPTIMAL
+
+    def __init__(self, *args):
+        super(MasterSolveMip, self).__init__(*args)
+        # create problem
+        self.model = Model("MasterProblem", sense=MINIMIZE, solver_name=CBC)
+        self.model.verbose = 0
+
+        self._formulate()
+
+    def update(self, new_route):
+        """Add new column.
+        The route selection variable is attached to the existing constraints
+        (column-wise), the rest of the model is left untouched.
+        """
+        self._add_route_selection_variable(new_route)
+
+    # Private methods to solve and output #
+
+    def _solve(self, relax: bool, time_limit: Optional[int]):
+        # Set variable types
+        # (CBC's LP re-solve of an integer model does not update the duals)
+        if relax != self._last_relax:
+            var_type = CONTINUOUS if relax else INTEGER
+            for var in self.model.vars:
+                var.var_type = var_type
+            self._last_relax = relax
+        if not relax:
+            # Force vehicle bound artificial variable to 0
+            for var in self.dummy_bound.values():
+                var.ub = 0
+        # Only specify time limit if given
+        return self.model.optimize(
+            max_seconds=time_limit if time_limit is not None else INF)
+
+    def _objective_value(self):
+        return self.model.objective_value
+
+    def _value(self, var):
+        return var.x
+
+    def _dual(self, constr):
+        return constr.pi
+
+    # Private methods for formulating and updating the problem #
+
+    def _formulate(self):
+        """
+        Set covering formulation.
+        Variables are continuous when relaxed, otherwise binary.
+        The variables of the initial routes are created first and the
+        constraints are built over them, CBC does not accept columns on
+        empty rows.
+        """
+        # Add variables #
+        # Route selection variables
+        for route in self.routes:
+            self._add_route_selection_variable(route)
+        # if dropping nodes is allowed
+        if self.drop_penalty:
+            self._add_drop_variables()
+
+        # if frequencies, dummy variables are needed to find initial solution
+        if self.periodic:
+            self._add_artificial_variables()
+
+        if self.num_vehicles and not self.periodic:
+            # Add dummy_vehicle variables
+            self._add_vehicle_dummy_variables()
+            self._add_bound_vehicles()
+
+        self._add_set_covering_constraints()
+
+    def _add_set_covering_constraints(self):
+        """
+        All vertices must be visited exactly once, or periodically if
+        frequencies are given.
+        If dropping nodes is allowed, the drop variable is activated
+        (as well as a penalty is the cost function).
+        """
+        covering_vars = defaultdict(list)
+        for route in self.routes:
+            for r in route.nodes():
+                if r in self._visit_constr_names:
+                    covering_vars[r].append(self.y[route.graph["name"]])
+        for node, var in self.drop.items():
+            covering_vars[node].append(var)
+        for node, var in self.dummy.items():
+            covering_vars[node].append(var)
+        for node, constr_name in self._visit_constr_names.items():
+            # Set RHS
+            right_hand_term = self.G.nodes[node][
+                "frequency"] if self.periodic else 1
+            # Save set covering constraints
+            self.set_covering_constrs[node] = self.model.add_constr(
+                xsum(covering_vars[node]) >= right_hand_term, name=constr_name)
+
+    def _add_route_selection_variable(self, route):
+        """
+        Adds the variable of a route. Once the constraints are set, its
+        column: its coefficients in the set covering constraints and in the
+        bound on its vehicle type.
+        """
+        constrs = [
+            self.set_covering_constrs[r]
+            for r in route.nodes()
+            if r in self.set_covering_constrs
+        ]
+        vehicle_type = route.graph["vehicle_type"]
+        # Bounds on the number of vehicles are not set if periodic
+        if vehicle_type in self.vehicle_bound_constrs:
+            constrs.append(self.vehicle_bound_constrs[vehicle_type])
+        y = self.model.add_var(
+            name="y{}".format(route.graph["name"]),
+            lb=0,
+            ub=1,
+            obj=route.graph["cost"],
+            var_type=CONTINUOUS if self._last_relax else INTEGER,
+            column=Column(constrs, [1] * len(constrs)) if constrs else None,
+        )
+        self.y[route.graph["name"]] = y
+        self._route_vars.append((route, y))
+
+    def _add_vehicle_dummy_variables(self):
+        for k in range(len(self.num_vehicles)):
+            self.dummy_bound[k] = self.model.add_var(
+                name="artificial_bound_%s" % k,
+                lb=0,
+                obj=1e10,
+                var_type=INTEGER,
+            )
+
+    def _add_drop_variables(self):
+        """
+        Boolean variable.
+        drop[v] takes value 1 if and only if node v is dropped.
+        """
+        for node in self.G.nodes():
+            if self.G.nodes[node]["demand"] > 0 and node != "Source":
+                self.drop[node] = self.model.add_var(
+                    name="drop_%s" % node,
+                    lb=0,
+                    ub=1,
+                    obj=self.drop_penalty,
+                    var_type=INTEGER,
+                )
+
+    def _add_artificial_variables(self):
+        """Continuous variable used for finding initial feasible solution."""
+        for node in self.G.nodes():
+            if self.G.nodes[node]["frequency"] > 1 and node != "Source":
+                self.dummy[node] = self.model.add_var(
+                    name="periodic_%s" % node,
+                    lb=0,
+                    obj=1e10,
+                    var_type=INTEGER,
+                )
+
+    def _add_bound_vehicles(self):
+        """
+        Bounds the number of routes of each vehicle type, the dummy variable
+        keeps the constraint feasible.
+        """
+        routes_of_type = defaultdict(list)
+        for route in self.routes:
+            routes_of_type[route.graph["vehicle_type"]].append(
+                self.y[route.graph["name"]])
+        for k, bound in enumerate(self.num_vehicles):
+            self.vehicle_bound_constrs[k] = self.model.add_constr(
+                xsum(routes_of_type[k]) - self.dummy_bound[k] <= bound,
+                name="upper_bound_vehicles_%s" % k)
@@ -1,7 +1,6 @@
 import logging
 from typing import Optional
 
-from networkx import shortest_path
 import pulp
 
 from vrpy.masterproblem import MasterProblemBase
@@ -16,43 +15,25 @@ class MasterSolvePulp(MasterProblemBase):
 
     Inherits problem parameters from MasterProblemBase
     """
+
+    _optimal_status = "Optimal"
+
     def __init__(self, *args):
         super(MasterSolvePulp, self).__init__(*args)
         # create problem
         self.prob = pulp.LpProblem("MasterProblem", pulp.LpMinimize)
         # objective
         self.objective = pulp.LpConstraintVar("objective")
-        # variables
-        self.y = {}  # route selection variable
-        self.drop = {}  # dropping variable
-        self.dummy = {}  # dummy variable
-        self.dummy_bound = {}  # dummy variable for vehicle bound cost
-        # constrs
-        self.set_covering_constrs = {}
-        self.vehicle_bound_constrs = {}
         self.drop_penalty_constrs = {}
+        # Problem the duals are read from
+        self._dual_problem = self.prob
         # Diving attributes
         self.pricing_heuristics = PricingHeuristics()
+        # Later relaxations only differ by a few columns
+        self._first_solve = True
 
         self._formulate()
 
-    def solve(self, relax, time_limit):
-        self._solve(relax, time_limit)
-        logger.debug("master problem")
-        logger.debug("Status: %s" % pulp.LpStatus[self.prob.status])
-        logger.debug("Objective: %s" % pulp.value(self.prob.objective))
-
-        if pulp.LpStatus[self.prob.status] != "Optimal":
-            raise Exception("problem " + str(pulp.LpStatus[self.prob.status]))
-        if relax:
-            for r in self.routes:
-                if pulp.value(self.y[r.graph["name"]]) > 0.5:
-                    logger.debug("route %s selected" % r.graph["name"])
-        duals = self.get_duals()
-        logger.debug("duals : %s" % duals)
-
-        return duals, self.prob.objective.value()
-
     def solve_and_dive(self, time_limit):
         self._solve(relax=True, time_limit=time_limit)
         self.pricing_heuristics.run_dive(self.prob)
@@ -61,6 +42,8 @@ class MasterSolvePulp(MasterProblemBase):
 
     def update(self, new_route):
         """Add new column.
+        The route selection variable is attached to the existing constraints
+        (column-wise), so the rest of the problem is left untouched.
         """
         self._add_route_selection_variable(new_route)
 
@@ -72,112 +55,101 @@ class MasterSolvePulp(MasterProblemBase):
         Returns:
             dict: Duals with constraint names as keys and dual variables as values
         """
-        duals = {}
-        # set covering duals
-        for node in self.G.nodes():
-            if (node not in ["Source", "Sink"]
-                    and "depot_from" not in self.G.nodes[node]
-                    and "depot_to" not in self.G.nodes[node]):
-                constr_name = "visit_node_%s" % node
-                if not relax:
-                    duals[node] = self.prob.constraints[constr_name].pi
-                else:
-                    duals[node] = relax.constraints[constr_name].pi
-        # num vehicles dual
-        if self.num_vehicles and not self.periodic:
-            duals["upper_bound_vehicles"] = {}
-            for k in range(len(self.num_vehicles)):
-                if not relax:
-                    duals["upper_bound_vehicles"][k] = self.prob.constraints[
-                        "upper_bound_vehicles_%s" % k].pi
-                else:
-                    duals["upper_bound_vehicles"][k] = relax.constraints[
-                        "upper_bound_vehicles_%s" % k].pi
-        return duals
-
-    def get_total_cost_and_routes(self, relax: bool):
-        best_routes = []
-        for r in self.routes:
-            val = pulp.value(self.y[r.graph["name"]])
-            if val is not None and val > 0:
-                logger.debug("%s cost %s load %s" % (
-                    shortest_path(r, "Source", "Sink"),
-                    r.graph["cost"],
-                    sum(self.G.nodes[v]["demand"] for v in r.nodes()),
-                ))
-
-                best_routes.append(r)
-        if self.drop_penalty:
-            self.dropped_nodes = [
-                v for v in self.drop if pulp.value(self.drop[v]) > 0.5
-            ]
-        self.prob.resolve()
-        total_cost = self.prob.objective.value()
-        if not relax and self.drop_penalty and len(self.dropped_nodes) > 0:
-            logger.info("dropped nodes : %s" % self.dropped_nodes)
-        logger.info("total cost = %s" % total_cost)
-        if not total_cost:
-            total_cost = 0
-        return total_cost, best_routes
-
-    def get_heuristic_distribution(self):
-        best_routes_heuristic = {
-            "BestPaths": 0,
-            "BestEdges1": 0,
-            "BestEdges2": 0,
-            "Exact": 0,
-            "Other": 0
-        }
-        best_routes = []
-        for r in self.routes:
-            val = pulp.value(self.y[r.graph["name"]])
-            if val is not None and val > 0:
-                """ logger.debug("%s cost %s load %s" % (
-                    shortest_path(r, "Source", "Sink"),
-                    r.graph["cost"],
-                    sum(self.G.nodes[v]["demand"] for v in r.nodes()),
-                )) """
-                try:
-                    best_routes_heuristic[r.graph["heuristic"]] += 1
-                except:
-                    r.graph["heuristic"] = "Other"
-                    best_routes_heuristic[r.graph["heuristic"]] += 1
-                best_routes.append(r)
-        return best_routes, best_routes_heuristic
+        self._dual_problem = relax if relax else self.prob
+        return super(MasterSolvePulp, self).get_duals()
 
     # Private methods to solve and output #
 
     def _solve(self, relax: bool, time_limit: Optional[int]):
         # Set variable types
-        for var in self.prob.variables():
-            if relax:
-                var.cat = pulp.LpContinuous
-            else:
-                var.cat = pulp.LpInteger
-                # Force vehicle bound artificial variable to 0
-                if "artificial_bound_" in var.name:
-                    var.upBound = 0
-                    var.lowBound = 0
-        # Solve with appropriate solver
+        if relax != self._last_relax:
+            cat = pulp.LpContinuous if relax else pulp.LpInteger
+            for var in self.prob.variables():
+                var.cat = cat
+            self._last_relax = relax
+        if not relax:
+            # Force vehicle bound artificial variable to 0
+            for var in self.dummy_bound.values():
+                var.upBound = 0
+                var.lowBound = 0
+        # Relaxations after the first one are solved with the dual simplex,
+        # falling back to the barrier if it does not reach optimality
+        dual_simplex = relax and not self._first_solve
+        first_relaxation = relax and self._first_solve
+        self._first_solve = False
+        # Duals are all that is needed from relaxations, only the integer
+        # problem crosses over from the barrier solution to a basis
+        self._solve_with(dual_simplex,
+                         time_limit,
+                         first_relaxation=first_relaxation,
+                         crossover=not relax)
+        if dual_simplex and pulp.LpStatus[self.prob.status] != "Optimal":
+            self._solve_with(False, time_limit)
+        return pulp.LpStatus[self.prob.status]
+
+    def _objective_value(self):
+        objective_value = self.prob.objective.value()
+        if objective_value is None:
+            # Columns were added after the last solve
+            self.prob.resolve()
+            objective_value = self.prob.objective.value()
+        return objective_value
+
+    def _value(self, var):
+        return var.varValue
+
+    def _dual(self, constr):
+        return self._dual_problem.constraints[constr.constraint.name].pi
+
+    def _solve_with(self,
+                    dual_simplex: bool,
+                    time_limit: Optional[int],
+                    first_relaxation: bool = False,
+                    crossover: bool = False):
+        """Solves the problem with the dual simplex or with the barrier.
+        If first_relaxation, there is no basis to start from: the concurrent
+        optimizer is used and the barrier stops at a looser convergence
+        tolerance, as it only prices the initial columns (not available with
+        cbc). The barrier is only followed by a crossover if crossover.
+        """
         if self.solver == "cbc":
+            if dual_simplex:
+                cbc_options = ["dualSimplex"]
+            else:
+                cbc_options = ["startalg", "barrier"]
+                if not crossover:
+                    cbc_options += ["crossover", "0"]
             self.prob.solve(
-                pulp.PULP_CBC_CMD(
-                    msg=0,
-                    maxSeconds=time_limit,
-                    options=["startalg", "barrier", "crossover", "0"],
-                ))
+                pulp.PULP_CBC_CMD(msg=0,
+                                  maxSeconds=time_limit,
+                                  options=cbc_options))
         elif self.solver == "cplex":
+            if dual_simplex:
+                cplex_options = ["set lpmethod 2"]
+            elif first_relaxation:
+                cplex_options = [
+                    "set lpmethod 6", "set barrier convergetol 1e-4"
+                ]
+            else:
+                cplex_options = ["set lpmethod 4"]
+                if not crossover:
+                    cplex_options.append("set barrier crossover -1")
             self.prob.solve(
-                pulp.CPLEX_CMD(
-                    msg=0,
-                    timelimit=time_limit,
-                    options=["set lpmethod 4", "set barrier crossover -1"],
-                ))
+                pulp.CPLEX_CMD(msg=0,
+                               timelimit=time_limit,
+                               options=cplex_options))
         elif self.solver == "gurobi":
-            gurobi_options = [
-                ("Method", 2),  # 2 = barrier
-                ("Crossover", 0),
-            ]
+            if dual_simplex:
+                gurobi_options = [("Method", 1)]  # 1 = dual simplex
+            elif first_relaxation:
+                gurobi_options = [
+                    ("Method", 3),  # 3 = concurrent
+                    ("BarConvTol", 1e-4),
+                ]
+            else:
+                gurobi_options = [("Method", 2)]  # 2 = barrier
+                if not crossover:
+                    gurobi_options.append(("Crossover", 0))
             # Only specify time limit if given (o.w. errors)
             if time_limit is not None:
                 gurobi_options.append((
@@ -230,34 +202,41 @@ class MasterSolvePulp(MasterProblemBase):
         If dropping nodes is allowed, the drop variable is activated
         (as well as a penalty is the cost function).
         """
-        for node in self.G.nodes():
-            if (node not in ["Source", "Sink"]
-                    and "depot_from" not in self.G.nodes[node]
-                    and "depot_to" not in self.G.nodes[node]):
-                # Set RHS
-                right_hand_term = self.G.nodes[node][
-                    "frequency"] if self.periodic else 1
-                # Save set covering constraints
-                self.set_covering_constrs[node] = pulp.LpConstraintVar(
-                    "visit_node_%s" % node, pulp.LpConstraintGE,
-                    right_hand_term)
+        for node, constr_name in self._visit_constr_names.items():
+            # Set RHS
+            right_hand_term = self.G.nodes[node][
+                "frequency"] if self.periodic else 1
+            # Save set covering constraints
+            self.set_covering_constrs[node] = pulp.LpConstraintVar(
+                constr_name, pulp.LpConstraintGE, right_hand_term)
 
     def _add_route_selection_variable(self, route):
-        self.y[route.graph["name"]] = pulp.LpVariable(
+        """
+        Adds the column of a route: its coefficients in the set covering
+        constraints, in the bound on its vehicle type and in the objective.
+        """
+        column = {
+            self.set_covering_constrs[r]: 1
+            for r in route.nodes()
+            if r in self.set_covering_constrs
+        }
+        vehicle_type = route.graph["vehicle_type"]
+        # Bounds on the number of vehicles are not set if periodic
+        if vehicle_type in self.vehicle_bound_constrs:
+            column[self.vehicle_bound_constrs[vehicle_type]] = 1
+        column[self.objective] = route.graph["cost"]
+        y = pulp.LpVariable(
             "y{}".format(route.graph["name"]),
             lowBound=0,
             upBound=1,
-            cat=pulp.LpInteger,
-            e=(pulp.lpSum(self.set_covering_constrs[r] for r in route.nodes()
-                          if r not in ["Source", "Sink"]) +
-               pulp.lpSum(self.vehicle_bound_constrs[k]
-                          for k in range(len(self.num_vehicles))
-                          if route.graph["vehicle_type"] == k) +
-               route.graph["cost"] * self.objective),
+            cat=pulp.LpContinuous if self._last_relax else pulp.LpInteger,
+            e=pulp.LpAffineExpression(column),
         )
+        self.y[route.graph["name"]] = y
+        self._route_vars.append((route, y))
 
     def _add_vehicle_dummy_variables(self):
-        for key in range(len(self.num_vehicles)):
+        for key in self.vehicle_bound_constrs:
             self.dummy_bound[key] = pulp.LpVariable(
                 "artificial_bound_%s" % key,
                 lowBound=0,
@@ -298,7 +277,6 @@ class MasterSolvePulp(MasterProblemBase):
 
     def _add_bound_vehicles(self):
         """Adds empty constraints and sets the right hand side"""
-        for k in range(len(self.num_vehicles)):
+        for k, bound in enumerate(self.num_vehicles):
             self.vehicle_bound_constrs[k] = pulp.LpConstraintVar(
-                "upper_bound_vehicles_%s" % k, pulp.LpConstraintLE,
-                self.num_vehicles[k])
+                "upper_bound_vehicles_%s" % k, pulp.LpConstraintLE, bound)
@@ -1,3 +1,10 @@
+import logging
+
+from vrpy.utils import walk
+
+logger = logging.getLogger(__name__)
+
+
 class MasterProblemBase:
     """Base class for the master problems.
 
@@ -11,6 +18,9 @@ class MasterProblemBase:
         relax (bool, optional): True if variables are continuous. Defaults to True.
     """
 
+    # Status of the solver when the problem is solved to optimality
+    _optimal_status = None
+
     def __init__(self, G, routes_with_node, routes, drop_penalty, num_vehicles,
                  periodic, solver):
         self.G = G
@@ -20,3 +30,124 @@ class MasterProblemBase:
         self.num_vehicles = num_vehicles
         self.periodic = periodic
         self.solver = solver
+        # variables
+        self.y = {}  # route selection variable
+        # Routes with their selection variable, in the order they were added
+        self._route_vars = []
+        self.drop = {}  # dropping variable
+        self.dummy = {}  # dummy variable
+        self.dummy_bound = {}  # dummy variable for vehicle bound cost
+        # Nodes to visit, with the name of their set covering constraint
+        self._visit_constr_names = {
+            node: "visit_node_%s" % node
+            for node in self.G.nodes()
+            if (node not in ["Source", "Sink"]
+                and "depot_from" not in self.G.nodes[node]
+                and "depot_to" not in self.G.nodes[node])
+        }
+        # constrs
+        self.set_covering_constrs = {}
+        self.vehicle_bound_constrs = {}
+        # Variable types are only set when switching from/to the relaxation
+        self._last_relax = None
+
+    def solve(self, relax, time_limit):
+        status = self._solve(relax, time_limit)
+        logger.debug("master problem")
+        logger.debug("Status: %s" % status)
+
+        if status != self._optimal_status:
+            raise Exception("problem status " + str(status))
+        objective_value = self._objective_value()
+        logger.debug("Objective: %s" % objective_value)
+        if not relax:
+            # Duals are not defined for the integer problem
+            return {}, objective_value
+        if logger.isEnabledFor(logging.DEBUG):
+            for r, val in self._route_values():
+                if val is not None and val > 0.5:
+                    logger.debug("route %s selected" % r.graph["name"])
+        duals = self.get_duals()
+        logger.debug("duals : %s" % duals)
+
+        return duals, objective_value
+
+    def get_duals(self):
+        """Gets the dual values of each constraint of the master problem.
+
+        Returns:
+            dict: Duals with constraint names as keys and dual variables as values
+        """
+        duals = {}
+        # set covering duals
+        for node, constr in self.set_covering_constrs.items():
+            duals[node] = self._dual(constr)
+        # num vehicles dual
+        if self.num_vehicles and not self.periodic:
+            duals["upper_bound_vehicles"] = {}
+            for k, constr in self.vehicle_bound_constrs.items():
+                duals["upper_bound_vehicles"][k] = self._dual(constr)
+        return duals
+
+    def get_total_cost_and_routes(self, relax: bool):
+        best_routes = []
+        for r, val in self._route_values():
+            if val is not None and val > 0:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s cost %s load %s" % (
+                        walk(r),
+                        r.graph["cost"],
+                        sum(self.G.nodes[v]["demand"] for v in r.nodes()),
+                    ))
+                best_routes.append(r)
+        if self.drop_penalty:
+            self.dropped_nodes = [
+                v for v, var in self.drop.items()
+                if (self._value(var) or 0) > 0.5
+            ]
+        total_cost = self._objective_value()
+        if not relax and self.drop_penalty and len(self.dropped_nodes) > 0:
+            logger.info("dropped nodes : %s" % self.dropped_nodes)
+        logger.info("total cost = %s" % total_cost)
+        if not total_cost:
+            total_cost = 0
+        return total_cost, best_routes
+
+    def get_heuristic_distribution(self):
+        best_routes_heuristic = {
+            "BestPaths": 0,
+            "BestEdges1": 0,
+            "BestEdges2": 0,
+            "Exact": 0,
+            "Other": 0
+        }
+        best_routes = []
+        for r, val in self._route_values():
+            if val is not None and val > 0:
+                if r.graph.get("heuristic") not in best_routes_heuristic:
+                    r.graph["heuristic"] = "Other"
+                best_routes_heuristic[r.graph["heuristic"]] += 1
+                best_routes.append(r)
+        return best_routes, best_routes_heuristic
+
+    # Solver specific methods #
+
+    def _solve(self, relax, time_limit):
+        """Solves the problem and returns the status of the solver."""
+        raise NotImplementedError
+
+    def _objective_value(self):
+        """Objective value of the last solve."""
+        raise NotImplementedError
+
+    def _value(self, var):
+        """Value of a variable in the last solve."""
+        raise NotImplementedError
+
+    def _dual(self, constr):
+        """Dual value of a constraint in the last solve."""
+        raise NotImplementedError
+
+    def _route_values(self):
+        """Routes of the problem with the value of their selection variable."""
+        return [(r, self._value(y)) for r, y in self._route_vars]
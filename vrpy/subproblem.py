@@ -103,17 +103,31 @@ class SubProblemBase:
         logger.debug("Pricing strategy %s, %s" %
                      (pricing_strategy, pricing_parameter))
 
+    def update_duals(self, duals):
+        """
+        Updates the dual values and the reduced costs of sub_G.
+        Only valid if sub_G is not pruned (pricing strategy "Exact").
+        """
+        self.duals = duals
+        self.run_subsolve = True
+        # sub_G has the same edges as G, its reduced costs are set directly
+        self._set_reduced_costs(self.sub_G)
+
     def add_reduced_cost_attribute(self):
         """Substracts the dual values to compute reduced cost on each edge."""
-        for edge in self.G.edges(data=True):
-            edge[2]["weight"] = edge[2]["cost"][self.vehicle_type]
-            for v in self.duals:
-                if edge[0] == v:
-                    edge[2]["weight"] -= self.duals[v]
-        if "upper_bound_vehicles" in self.duals:
-            for v in self.G.successors("Source"):
-                self.G.edges["Source", v]["weight"] -= self.duals[
-                    "upper_bound_vehicles"][self.vehicle_type]
+        self._set_reduced_costs(self.G)
+
+    def _set_reduced_costs(self, graph):
+        """Sets the "weight" attribute of each edge of graph in one pass."""
+        vehicle_type = self.vehicle_type
+        duals = self.duals
+        for (i, j, data) in graph.edges(data=True):
+            # Only customers have a dual value
+            data["weight"] = data["cost"][vehicle_type] - duals.get(i, 0)
+        if "upper_bound_vehicles" in duals:
+            dual = duals["upper_bound_vehicles"][vehicle_type]
+            for data in graph.succ["Source"].values():
+                data["weight"] -= dual
 
     def discard_nodes(self):
         """Removes nodes with marginal cost = 0."""
@@ -2,7 +2,7 @@ import logging
 from math import floor
 
 from numpy import array, zeros
-from networkx import DiGraph, add_path
+from networkx import DiGraph
 
 from cspy import BiDirectional
 
@@ -24,6 +24,7 @@ class SubProblemCSPY(SubProblemBase):
         # Pass arguments to base
         super(SubProblemCSPY, self).__init__(*args)
         self.exact = exact
+        self._exact_init = exact
         # Resource names
         self.resources = [
             "stops/mono",
@@ -55,6 +56,11 @@ class SubProblemCSPY(SubProblemBase):
         # Initialize max feasible arrival time
         self.T = 0
 
+    def update_duals(self, duals):
+        """Updates the dual values and resets the exact flag."""
+        super(SubProblemCSPY, self).update_duals(duals)
+        self.exact = self._exact_init
+
     # @profile
     def solve(self, time_limit):
         """
@@ -153,13 +159,19 @@ class SubProblemCSPY(SubProblemBase):
     def add_new_route(self, path):
         """Create new route as DiGraph and add to pool of columns"""
         route_id = len(self.routes) + 1
-        new_route = DiGraph(name=route_id)
-        add_path(new_route, path)
-        self.total_cost = 0
-        for (i, j) in new_route.edges():
-            edge_cost = self.sub_G.edges[i, j]["cost"][self.vehicle_type]
-            self.total_cost += edge_cost
-            new_route.edges[i, j]["cost"] = edge_cost
+        edges = list(zip(path[:-1], path[1:]))
+        costs = [
+            self.sub_G.edges[i, j]["cost"][self.vehicle_type]
+            for (i, j) in edges
+        ]
+        new_route = DiGraph(
+            [(i, j, {
+                "cost": edge_cost
+            }) for ((i, j), edge_cost) in zip(edges, costs)],
+            name=route_id,
+        )
+        self.total_cost = sum(costs)
+        for (i, j) in edges:
             if i != "Source":
                 self.routes_with_node[i].append(new_route)
         new_route.graph["cost"] = self.total_cost
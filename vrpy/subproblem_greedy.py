@@ -1,5 +1,5 @@
 from random import choice
-from networkx import DiGraph, add_path
+from networkx import DiGraph
 
 # from os import sys
 # sys.path.append("../")
@@ -158,13 +158,19 @@ class SubProblemGreedy(SubProblemBase):
     def _add_new_route(self):
         """Create new route as DiGraph and add to pool of columns"""
         route_id = len(self.routes) + 1
-        new_route = DiGraph(name=route_id)
-        add_path(new_route, self._current_path)
-        self.total_cost = 0
-        for (i, j) in new_route.edges():
-            edge_cost = self.sub_G.edges[i, j]["cost"][self.vehicle_type]
-            self.total_cost += edge_cost
-            new_route.edges[i, j]["cost"] = edge_cost
+        edges = list(zip(self._current_path[:-1], self._current_path[1:]))
+        costs = [
+            self.sub_G.edges[i, j]["cost"][self.vehicle_type]
+            for (i, j) in edges
+        ]
+        new_route = DiGraph(
+            [(i, j, {
+                "cost": edge_cost
+            }) for ((i, j), edge_cost) in zip(edges, costs)],
+            name=route_id,
+        )
+        self.total_cost = sum(costs)
+        for (i, j) in edges:
             if i != "Source":
                 self.routes_with_node[i].append(new_route)
         new_route.graph["cost"] = self.total_cost
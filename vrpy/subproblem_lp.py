@@ -1,7 +1,8 @@
-from networkx import DiGraph, negative_edge_cycle, shortest_path
+from networkx import DiGraph, negative_edge_cycle
 import pulp
 import logging
 from .subproblem import SubProblemBase
+from .utils import walk
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +68,7 @@ class SubProblemLP(SubProblemBase):
         self.routes.append(new_route)
 
         logger.debug("new route %s %s" %
-                     (route_id, shortest_path(new_route, "Source", "Sink")))
+                     (route_id, walk(new_route)))
         logger.debug("new route reduced cost %s" %
                      pulp.value(self.prob.objective))
         logger.debug("new route cost = %s" % self.total_cost)
@@ -0,0 +1,13 @@
+"""Helpers shared by the modules."""
+
+
+def walk(route):
+    """
+    Returns the route as node list.
+    Routes are simple paths, the successors are followed up to the Sink.
+    """
+    node_list = ["Source"]
+    successors = route.succ
+    while node_list[-1] != "Sink":
+        node_list.append(next(iter(successors[node_list[-1]])))
+    return node_list